@@ -1,9 +1,11 @@
 """Home Assistant entity for interacting with Afero Light."""
 
 from functools import partial
+from itertools import chain
 import logging
 import asyncio
-from typing import Optional
+import re
+from typing import Any, Callable, Collection, Iterator, NamedTuple, Optional
 
 from aioafero import EventType
 from aioafero.v1 import AferoBridgeV1, LightController
@@ -20,8 +22,9 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.color import brightness_to_value, value_to_brightness
+from homeassistant.util.color import value_to_brightness
 
 from .bridge import HubspaceBridge
 from .const import DOMAIN
@@ -30,10 +33,34 @@ from .shared_framebuffer import get_shared_context
 
 LOGGER = logging.getLogger(__name__)
 
+# Afero color modes
+AFERO_MODE_COLOR = "color"
+AFERO_MODE_MIXED = "mixed"
+AFERO_MODE_SEQUENCE = "sequence"
+AFERO_MODE_WHITE = "white"
+
+
+def to_device_brightness(brightness: int) -> int:
+    """Convert a Home Assistant brightness (1..255) to the device range (1..100).
+
+    Integer form of ``int(brightness_to_value((1, 100), brightness))``.
+    """
+    return int(brightness * 100 // 255)
+
 
 class HubspaceLight(HubspaceBaseEntity, LightEntity):
     """Representation of an Afero light."""
 
+    # _attr_* fields are left out as Home Assistant wraps them in properties
+    __slots__ = (
+        "_async_request_call",
+        "_cache",
+        "_color_mode_map",
+        "_fallback_color_modes",
+        "_resource_id",
+        "_set_state",
+    )
+
     def __init__(
         self,
         bridge: HubspaceBridge,
@@ -43,325 +70,488 @@ class HubspaceLight(HubspaceBaseEntity, LightEntity):
         """Initialize an Afero light."""
 
         super().__init__(bridge, controller, resource)
-        self._supported_features: LightEntityFeature = LightEntityFeature(0)
-        supported_color_modes = {ColorMode.ONOFF}
-        if self.resource.supports_color:
-            supported_color_modes.add(ColorMode.RGB)
-        if self.resource.supports_color_temperature:
-            supported_color_modes.add(ColorMode.COLOR_TEMP)
-        if self.resource.supports_dimming:
-            supported_color_modes.add(ColorMode.BRIGHTNESS)
-        self._attr_supported_color_modes = filter_supported_color_modes(
-            supported_color_modes
+        self._resource_id: str = resource.id
+        self._async_request_call = bridge.async_request_call
+        self._set_state = controller.set_state
+        self._attr_supported_features = (
+            LightEntityFeature.EFFECT if self.resource.effect else LightEntityFeature(0)
+        )
+        self._attr_supported_color_modes = self._build_supported_modes(resource)
+        self._fallback_color_modes = get_fallback_color_modes(
+            self._attr_supported_color_modes
+        )
+        self._color_mode_map = get_color_mode_map(self._attr_supported_color_modes)
+        # The supported temperature range is fixed for a device
+        if color_temp := self.resource.color_temperature:
+            supported_temps = color_temp.supported
+            self._attr_min_color_temp_kelvin = min(supported_temps)
+            self._attr_max_color_temp_kelvin = max(supported_temps)
+        else:
+            self._attr_min_color_temp_kelvin = None
+            self._attr_max_color_temp_kelvin = None
+        # The effect catalog is fixed for a device
+        effect = self.resource.effect
+        self._attr_effect_list = (
+            (list(chain.from_iterable(effect.effects.values())) or None)
+            if effect
+            else None
+        )
+        # Values derived from the resource, cleared whenever it is updated
+        self._cache: dict[str, Any] = {}
+
+    @classmethod
+    def _build_supported_modes(cls, resource: Light) -> frozenset[ColorMode]:
+        """Get the color modes this entity supports for the resource."""
+        return get_supported_color_modes(
+            resource.supports_color,
+            resource.supports_color_temperature,
+            resource.supports_dimming,
         )
 
+    @callback
+    def on_update(self) -> None:
+        """Drop values derived from the resource so they are recomputed."""
+        self._cache.clear()
+
     @property
     def brightness(self) -> int | None:
         """The brightness of this light between 1..255."""
-        return (
-            value_to_brightness((1, 100), self.resource.brightness)
-            if self.resource.dimming
-            else None
-        )
+        if "brightness" not in self._cache:
+            self._cache["brightness"] = (
+                value_to_brightness((1, 100), self.resource.brightness)
+                if self.resource.dimming
+                else None
+            )
+        return self._cache["brightness"]
 
     @property
     def color_mode(self) -> ColorMode:
         """Get the current color mode for the light."""
-        return get_color_mode(self.resource, self._attr_supported_color_modes)
+        return get_color_mode(
+            self.resource, self._color_mode_map, self._fallback_color_modes
+        )
 
     @property
     def color_temp_kelvin(self) -> int | None:
         """Get the current color temperature for the light."""
-        return (
-            self.resource.color_temperature.temperature
-            if self.resource.color_temperature
-            else None
-        )
+        if "color_temp_kelvin" not in self._cache:
+            color_temp = self.resource.color_temperature
+            self._cache["color_temp_kelvin"] = (
+                color_temp.temperature if color_temp else None
+            )
+        return self._cache["color_temp_kelvin"]
 
     @property
     def effect(self) -> str | None:
         """Get the current effect for the light."""
-        return (
-            self.resource.effect.effect
-            if (self.resource.effect and self.resource.color_mode.mode == "sequence")
-            else None
-        )
-
-    @property
-    def effect_list(self) -> list[str] | None:
-        """Get all available effects for the light."""
-        all_effects = []
-        for effects in self.resource.effect.effects.values() or []:
-            all_effects.extend(effects)
-        return all_effects or None
+        if "effect" not in self._cache:
+            effect = self.resource.effect
+            self._cache["effect"] = (
+                effect.effect
+                if (effect and self.resource.color_mode.mode == AFERO_MODE_SEQUENCE)
+                else None
+            )
+        return self._cache["effect"]
 
     @property
     def is_on(self) -> bool | None:
         """Determine if the light is currently on."""
-        return self.resource.is_on
-
-    @property
-    def max_color_temp_kelvin(self) -> int | None:
-        """Get the lights maximum temperature color."""
-        return (
-            max(self.resource.color_temperature.supported)
-            if self.resource.color_temperature
-            else None
-        )
-
-    @property
-    def min_color_temp_kelvin(self) -> int | None:
-        """Get the lights minimum temperature color."""
-        return (
-            min(self.resource.color_temperature.supported)
-            if self.resource.color_temperature
-            else None
-        )
+        if "is_on" not in self._cache:
+            self._cache["is_on"] = self.resource.is_on
+        return self._cache["is_on"]
 
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Get the lights current RGB colors."""
-        return (
-            (
-                self.resource.color.red,
-                self.resource.color.green,
-                self.resource.color.blue,
+        if "rgb_color" not in self._cache:
+            color = self.resource.color
+            self._cache["rgb_color"] = (
+                (color.red, color.green, color.blue) if color else None
             )
-            if self.resource.color
-            else None
-        )
-
-    @property
-    def supported_color_modes(self) -> set[ColorMode]:
-        """Get all supported color modes."""
-        return self._attr_supported_color_modes
-
-    @property
-    def supported_features(self) -> LightEntityFeature:
-        """Get all supported light features."""
-        if self.resource.effect:
-            return LightEntityFeature(0) | LightEntityFeature.EFFECT
-        return LightEntityFeature(0)
+        return self._cache["rgb_color"]
 
     @update_decorator
     async def async_turn_on(self, **kwargs) -> None:
         """Turn device on."""
-        brightness: int | None = None
+        # Only send what was requested; set_state treats missing values as
+        # unchanged and this keeps the request payload small
+        state: dict[str, Any] = {"on": True}
         if ATTR_BRIGHTNESS in kwargs:
-            brightness = int(brightness_to_value((1, 100), kwargs[ATTR_BRIGHTNESS]))
+            state["brightness"] = to_device_brightness(kwargs[ATTR_BRIGHTNESS])
         temperature: int | None = kwargs.get(ATTR_COLOR_TEMP_KELVIN)
         color: tuple[int, int, int] | None = kwargs.get(ATTR_RGB_COLOR)
         effect: str | None = kwargs.get(ATTR_EFFECT)
-        color_mode: str | None = None
+        if temperature is not None:
+            state["temperature"] = temperature
+        if color is not None:
+            state["color"] = color
+        if effect is not None:
+            state["effect"] = effect
         if temperature:
-            color_mode = "white"
+            state["color_mode"] = AFERO_MODE_WHITE
         elif color:
-            color_mode = "color"
+            state["color_mode"] = AFERO_MODE_COLOR
         elif effect:
-            color_mode = "sequence"
-        await self.bridge.async_request_call(
-            self.controller.set_state,
-            device_id=self.resource.id,
-            on=True,
-            brightness=brightness,
-            temperature=temperature,
-            color=color,
-            color_mode=color_mode,
-            effect=effect,
+            state["color_mode"] = AFERO_MODE_SEQUENCE
+        await self._async_request_call(
+            self._set_state, device_id=self._resource_id, **state
         )
 
     @update_decorator
     async def async_turn_off(self, **kwargs) -> None:
         """Turn device off."""
-        await self.bridge.async_request_call(
-            self.controller.set_state,
-            device_id=self.resource.id,
+        await self._async_request_call(
+            self._set_state,
+            device_id=self._resource_id,
             on=False,
         )
 
 
-def get_color_mode(resource: Light, supported_modes: set[ColorMode]) -> ColorMode:
+# Filtered color modes keyed by (color, temperature, dimming) support
+_supported_color_modes: dict[tuple[bool, bool, bool], frozenset[ColorMode]] = {}
+
+
+def get_supported_color_modes(
+    color: bool, temperature: bool, dimming: bool
+) -> frozenset[ColorMode]:
+    """Get the supported color modes for the given capabilities.
+
+    Entities with the same capabilities share the result.
+
+    :param color: Light supports RGB color
+    :param temperature: Light supports color temperature
+    :param dimming: Light supports dimming
+    """
+    key = (bool(color), bool(temperature), bool(dimming))
+    modes = _supported_color_modes.get(key)
+    if modes is None:
+        supported = {ColorMode.ONOFF}
+        if key[0]:
+            supported.add(ColorMode.RGB)
+        if key[1]:
+            supported.add(ColorMode.COLOR_TEMP)
+        if key[2]:
+            supported.add(ColorMode.BRIGHTNESS)
+        modes = frozenset(filter_supported_color_modes(supported))
+        _supported_color_modes[key] = modes
+    return modes
+
+
+def _get_white_color_mode(supported_modes: Collection[ColorMode]) -> ColorMode:
+    """Determine the mode for a light in white mode."""
+    if ColorMode.COLOR_TEMP in supported_modes:
+        return ColorMode.COLOR_TEMP
+    if ColorMode.BRIGHTNESS in supported_modes:
+        return ColorMode.BRIGHTNESS
+    return ColorMode.ONOFF
+
+
+# Afero color modes that map onto a Home Assistant color mode
+COLOR_MODE_HANDLERS: dict[str, Callable[[Collection[ColorMode]], ColorMode]] = {
+    AFERO_MODE_COLOR: lambda _: ColorMode.RGB,
+    AFERO_MODE_WHITE: _get_white_color_mode,
+}
+
+
+def get_fallback_color_modes(
+    supported_modes: Collection[ColorMode],
+) -> tuple[ColorMode, ColorMode]:
+    """Get the modes used when the light does not report a known color mode.
+
+    :param supported_modes: Supported color modes
+    :return: Mode when no color mode is set, mode for an unknown color mode
+    """
+    if not len(supported_modes):
+        return ColorMode.ONOFF, ColorMode.ONOFF
+    # Sets of modes have no stable order between runs, so sort them
+    modes = sorted(supported_modes)
+    return modes[0], modes[-1]
+
+
+def get_color_mode_map(
+    supported_modes: Collection[ColorMode],
+) -> dict[str, ColorMode]:
+    """Get the Home Assistant color mode for each known Afero color mode.
+
+    :param supported_modes: Supported color modes
+    """
+    return {
+        afero_mode: handler(supported_modes)
+        for afero_mode, handler in COLOR_MODE_HANDLERS.items()
+    }
+
+
+def get_color_mode(
+    resource: Light,
+    color_mode_map: dict[str, ColorMode],
+    fallback_modes: tuple[ColorMode, ColorMode],
+) -> ColorMode:
     """Determine the correct mode.
 
     :param resource: Light from aioafero
-    :param supported_modes: Supported color modes
+    :param color_mode_map: Result of get_color_mode_map for the supported modes
+    :param fallback_modes: Result of get_fallback_color_modes for the supported modes
     """
-    if not resource.color_mode:
-        return list(supported_modes)[0] if len(supported_modes) else ColorMode.ONOFF
-    if resource.color_mode.mode == "color":
-        return ColorMode.RGB
-    if resource.color_mode.mode == "white":
-        if ColorMode.COLOR_TEMP in supported_modes:
-            return ColorMode.COLOR_TEMP
-        if ColorMode.BRIGHTNESS in supported_modes:
-            return ColorMode.BRIGHTNESS
-        return ColorMode.ONOFF
-    return list(supported_modes)[-1] if len(supported_modes) else ColorMode.ONOFF
+    color_mode = resource.color_mode
+    if not color_mode:
+        return fallback_modes[0]
+    return color_mode_map.get(color_mode.mode, fallback_modes[1])
 
 
 # ============================================================================
 # DUAL MODE LIGHT COMPONENTS
 # ============================================================================
 
+# Name fragments identifying lights with independent color / white channels.
+# Add new dual-mode models here.
+DUAL_MODE_KEYWORDS: tuple[str, ...] = ("flushmount",)
+
+
+def get_device_names(resource: Light) -> tuple[str, str]:
+    """Get the name and default name of a device, empty when not set.
+
+    :param resource: Light from aioafero
+    """
+    dev_info = getattr(resource, "device_information", None)
+    return (
+        getattr(dev_info, "name", None) or "",
+        getattr(dev_info, "default_name", None) or "",
+    )
+
+
 def has_mixed_mode_capability(resource: Light) -> bool:
     """Check if a light has mixed mode capability (separate color and white controls)."""
-    try:
-        # Check if the device has mixed mode in its color mode capabilities
-        if hasattr(resource, 'color_mode') and resource.color_mode:
-            # For now, we'll use a broader check - if device has both color and white brightness controls
-            return has_separate_brightness_controls(resource)
-        return False
-    except Exception as e:
-        LOGGER.debug(f"Error checking mixed mode capability: {e}")
-        return False
+    # Check if the device has mixed mode in its color mode capabilities
+    if getattr(resource, "color_mode", None):
+        # For now, we'll use a broader check - if device has both color and white brightness controls
+        return has_separate_brightness_controls(resource)
+    return False
 
 
 def has_separate_brightness_controls(resource: Light) -> bool:
     """Check if device has separate brightness controls for color and white."""
+    # Cheapest capability checks first so non dual-mode lights exit early
+    if not getattr(resource, "supports_dimming", None):
+        return False
+    if not (
+        getattr(resource, "supports_color", None) or getattr(resource, "color", None)
+    ):
+        return False
+    if not (
+        getattr(resource, "supports_color_temperature", None)
+        or getattr(resource, "color_temperature", None)
+    ):
+        return False
+
+    # Check for Hampton Bay Flushmount Light or similar dual-mode devices
+    name, default_name = get_device_names(resource)
+    identifiers = f"{name.lower()}\x00{default_name.lower()}"
+    return any(keyword in identifiers for keyword in DUAL_MODE_KEYWORDS)
+
+
+# Writes to both halves of a dual-mode light that arrive within this window
+# (e.g. a scene toggling color and white) are merged into a single request
+DUAL_MODE_WRITE_WINDOW: float = 0.02
+
+# Pending write per device: explicit values, default values, shared result
+_pending_dual_mode_writes: dict[
+    str, tuple[dict[str, Any], dict[str, Any], asyncio.Future]
+] = {}
+
+
+async def async_set_dual_mode_state(
+    bridge: HubspaceBridge,
+    controller: LightController,
+    device_id: str,
+    defaults: dict[str, Any] | None = None,
+    **state: Any,
+) -> None:
+    """Send state for a dual-mode light, merging writes made close together.
+
+    The first caller for a device waits DUAL_MODE_WRITE_WINDOW seconds for
+    other writes, then issues a single set_state with the merged values.
+    Later values win over earlier ones and explicit values win over
+    defaults, so turning on both portions together keeps both brightnesses.
+
+    :param defaults: Values only sent if no merged write sets them
+    """
+    pending = _pending_dual_mode_writes.get(device_id)
+    if pending is not None:
+        pending[0].update(state)
+        pending[1].update(defaults or ())
+        # Shielded so a cancelled caller does not cancel the shared result
+        await asyncio.shield(pending[2])
+        return
+    merged: dict[str, Any] = dict(state)
+    merged_defaults: dict[str, Any] = dict(defaults or ())
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _pending_dual_mode_writes[device_id] = (merged, merged_defaults, future)
     try:
-        # Check if device supports both color and white controls
-        has_color = (hasattr(resource, 'supports_color') and resource.supports_color) or (hasattr(resource, 'color') and resource.color)
-        has_temperature = (hasattr(resource, 'supports_color_temperature') and resource.supports_color_temperature) or (hasattr(resource, 'color_temperature') and resource.color_temperature)
-        has_dimming = hasattr(resource, 'supports_dimming') and resource.supports_dimming
-        
-        # Check for Hampton Bay Flushmount Light or similar dual-mode devices
-        # This could be expanded to include other devices with mixed-mode capability
-        device_identifiers = []
-        if hasattr(resource, 'device_information') and resource.device_information and resource.device_information.name:
-            device_identifiers.append(resource.device_information.name.lower())
-        if hasattr(resource, 'device_information') and resource.device_information and resource.device_information.default_name:
-            device_identifiers.append(resource.device_information.default_name.lower())
-        
-        # Check if this looks like a device that might have dual-mode capability
-        # Devices with both RGB and tunable white usually have this capability
-        is_dual_mode_candidate = (
-            has_color and has_temperature and has_dimming and
-            any('flushmount' in identifier for identifier in device_identifiers)
+        try:
+            await asyncio.sleep(DUAL_MODE_WRITE_WINDOW)
+        finally:
+            # Writes from here on start a new request
+            del _pending_dual_mode_writes[device_id]
+        await bridge.async_request_call(
+            controller.set_state,
+            device_id=device_id,
+            **{**merged_defaults, **merged},
         )
-        
-        return is_dual_mode_candidate
-    except Exception as e:
-        LOGGER.debug(f"Error checking brightness controls: {e}")
-        return False
+    except BaseException as err:
+        # Merged writes fail with the request, or were not sent if cancelled
+        future.set_exception(
+            err
+            if isinstance(err, Exception)
+            else HomeAssistantError("Dual-mode light update was cancelled")
+        )
+        # Raised below, so the copy held by the future needs no logging
+        future.exception()
+        raise
+    future.set_result(None)
+
 
+def should_create_dual_lights(resource: Light, dual_mode_ids: set[str]) -> bool:
+    """Determine if we should create separate color and white light entities.
 
-def should_create_dual_lights(resource: Light) -> bool:
-    """Determine if we should create separate color and white light entities."""
-    result = has_mixed_mode_capability(resource) and has_separate_brightness_controls(resource)
+    Only dual-mode lights are remembered: the check uses the color mode and
+    names, which may not be reported yet, so other lights are checked again.
+
+    :param resource: Light from aioafero
+    :param dual_mode_ids: Device ids found to be dual-mode, kept for one config entry
+    """
+    if resource.id in dual_mode_ids:
+        return True
+    result = has_mixed_mode_capability(resource)
     if result:
-        LOGGER.info(f"Device {resource.id} has dual-mode capability - creating separate color and white entities")
+        dual_mode_ids.add(resource.id)
+        LOGGER.info(
+            "Device %s has dual-mode capability - creating separate color and white entities",
+            resource.id,
+        )
     return result
 
 
-class HubspaceColorLight(HubspaceLight):
-    """Representation of the color portion of a dual-mode light."""
-    
-    def __init__(self, bridge: HubspaceBridge, controller: LightController, resource: Light) -> None:
+class HubspaceDualModeLight(HubspaceLight):
+    """Shared behaviour for either portion of a dual-mode light."""
+
+    __slots__ = ("_set_mixed_state",)
+
+    # Set by subclasses: entity name suffix and the Afero field holding the
+    # brightness of this portion
+    _portion: str
+    _brightness_field: str
+
+    def __init__(
+        self, bridge: HubspaceBridge, controller: LightController, resource: Light
+    ) -> None:
+        """Initialize one portion of a dual-mode light."""
         super().__init__(bridge, controller, resource)
-        self._attr_name = f"{self._attr_name} - Color"
-        self._attr_unique_id = f"{resource.id}_color"
-        # Force color mode only - remove temperature support for color portion
-        supported_modes = {ColorMode.ONOFF}
-        if self.resource.supports_color:
-            supported_modes.add(ColorMode.RGB)
-        if self.resource.supports_dimming:
-            supported_modes.add(ColorMode.BRIGHTNESS)
-        self._attr_supported_color_modes = filter_supported_color_modes(supported_modes)
-    
+        self._attr_name = f"{self._attr_name} - {self._portion}"
+        self._attr_unique_id = f"{resource.id}_{self._portion.lower()}"
+        # Both portions always write in mixed mode
+        self._set_mixed_state = partial(
+            async_set_dual_mode_state,
+            bridge,
+            controller,
+            self._resource_id,
+            color_mode=AFERO_MODE_MIXED,
+        )
+
+    @staticmethod
+    def _get_turn_on_brightness(kwargs: dict[str, Any]) -> int:
+        """Get the requested brightness, defaulting to full brightness."""
+        if ATTR_BRIGHTNESS in kwargs:
+            return to_device_brightness(kwargs[ATTR_BRIGHTNESS])
+        return 100
+
+    @staticmethod
+    def _get_optional_state(
+        kwargs: dict[str, Any], attr: str, field: str
+    ) -> dict[str, Any]:
+        """Map a Home Assistant attribute to set_state only if it was provided."""
+        value = kwargs.get(attr)
+        return {field: value} if value is not None else {}
+
+    @update_decorator
+    async def async_turn_off(self, **kwargs) -> None:
+        """Turn off only this portion, leaving the other portion alone."""
+        await self._set_mixed_state(**{self._brightness_field: 0})
+
+
+class HubspaceColorLight(HubspaceDualModeLight):
+    """Representation of the color portion of a dual-mode light."""
+
+    __slots__ = ()
+
+    _portion = "Color"
+    _brightness_field = "colorBrightness"
+
+    @classmethod
+    def _build_supported_modes(cls, resource: Light) -> frozenset[ColorMode]:
+        """Force color mode only - remove temperature support for color portion."""
+        return get_supported_color_modes(
+            resource.supports_color, False, resource.supports_dimming
+        )
+
     @property
     def color_mode(self) -> ColorMode:
         """Return the color mode - RGB if we have color, brightness otherwise."""
         if ColorMode.RGB in self._attr_supported_color_modes and self.resource.color:
             return ColorMode.RGB
-        elif ColorMode.BRIGHTNESS in self._attr_supported_color_modes:
+        if ColorMode.BRIGHTNESS in self._attr_supported_color_modes:
             return ColorMode.BRIGHTNESS
-        else:
-            return ColorMode.ONOFF
-    
+        return ColorMode.ONOFF
+
     @update_decorator
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the color portion only, independently of white."""
-        brightness: int | None = None
-        if ATTR_BRIGHTNESS in kwargs:
-            brightness = int(brightness_to_value((1, 100), kwargs[ATTR_BRIGHTNESS]))
-        else:
-            brightness = 100  # Default to full brightness if not specified
-        color: tuple[int, int, int] | None = kwargs.get(ATTR_RGB_COLOR, None)
-        # Always use mixed mode and set whiteBrightness to 0
-        await self.bridge.async_request_call(
-            self.controller.set_state,
-            device_id=self.resource.id,
+        # Always use mixed mode and set whiteBrightness to 0, unless the white
+        # portion is turned on in the same request
+        await self._set_mixed_state(
             on=True,
-            color=color,
-            color_mode="mixed",
-            colorBrightness=brightness,
-            whiteBrightness=0
-        )
-
-    @update_decorator
-    async def async_turn_off(self, **kwargs) -> None:
-        """Turn off only the color portion (set colorBrightness to 0, leave white alone)."""
-        await self.bridge.async_request_call(
-            self.controller.set_state,
-            device_id=self.resource.id,
-            color_mode="mixed",
-            colorBrightness=0
+            colorBrightness=self._get_turn_on_brightness(kwargs),
+            defaults={"whiteBrightness": 0},
+            **self._get_optional_state(kwargs, ATTR_RGB_COLOR, "color"),
         )
 
 
-class HubspaceWhiteLight(HubspaceLight):
+class HubspaceWhiteLight(HubspaceDualModeLight):
     """Representation of the white portion of a dual-mode light."""
-    
-    def __init__(self, bridge: HubspaceBridge, controller: LightController, resource: Light) -> None:
-        super().__init__(bridge, controller, resource)
-        self._attr_name = f"{self._attr_name} - White"
-        self._attr_unique_id = f"{resource.id}_white"
-        # Force white modes only - remove RGB support for white portion
-        supported_modes = {ColorMode.ONOFF}
-        if self.resource.supports_color_temperature:
-            supported_modes.add(ColorMode.COLOR_TEMP)
-        if self.resource.supports_dimming:
-            supported_modes.add(ColorMode.BRIGHTNESS)
-        self._attr_supported_color_modes = filter_supported_color_modes(supported_modes)
-    
+
+    __slots__ = ()
+
+    _portion = "White"
+    _brightness_field = "whiteBrightness"
+
+    @classmethod
+    def _build_supported_modes(cls, resource: Light) -> frozenset[ColorMode]:
+        """Force white modes only - remove RGB support for white portion."""
+        return get_supported_color_modes(
+            False, resource.supports_color_temperature, resource.supports_dimming
+        )
+
     @property
     def color_mode(self) -> ColorMode:
         """Return the color mode - color temp if available, brightness otherwise."""
-        if ColorMode.COLOR_TEMP in self._attr_supported_color_modes and self.resource.color_temperature:
+        if (
+            ColorMode.COLOR_TEMP in self._attr_supported_color_modes
+            and self.resource.color_temperature
+        ):
             return ColorMode.COLOR_TEMP
-        elif ColorMode.BRIGHTNESS in self._attr_supported_color_modes:
+        if ColorMode.BRIGHTNESS in self._attr_supported_color_modes:
             return ColorMode.BRIGHTNESS
-        else:
-            return ColorMode.ONOFF
-    
+        return ColorMode.ONOFF
+
     @update_decorator
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the white portion only, independently of color."""
-        brightness: int | None = None
-        if ATTR_BRIGHTNESS in kwargs:
-            brightness = int(brightness_to_value((1, 100), kwargs[ATTR_BRIGHTNESS]))
-        else:
-            brightness = 100  # Default to full brightness if not specified
-        temperature: int | None = kwargs.get(ATTR_COLOR_TEMP_KELVIN, None)
-        # Always use mixed mode and set colorBrightness to 0
-        await self.bridge.async_request_call(
-            self.controller.set_state,
-            device_id=self.resource.id,
+        # Always use mixed mode and set colorBrightness to 0, unless the color
+        # portion is turned on in the same request
+        await self._set_mixed_state(
             on=True,
-            temperature=temperature,
-            color_mode="mixed",
-            whiteBrightness=brightness,
-            colorBrightness=0
-        )
-
-    @update_decorator
-    async def async_turn_off(self, **kwargs) -> None:
-        """Turn off only the white portion (set whiteBrightness to 0, leave color alone)."""
-        await self.bridge.async_request_call(
-            self.controller.set_state,
-            device_id=self.resource.id,
-            color_mode="mixed",
-            whiteBrightness=0
+            whiteBrightness=self._get_turn_on_brightness(kwargs),
+            defaults={"colorBrightness": 0},
+            **self._get_optional_state(kwargs, ATTR_COLOR_TEMP_KELVIN, "temperature"),
         )
 
 
@@ -369,209 +559,296 @@ class HubspaceWhiteLight(HubspaceLight):
 # STRING LIGHT COMPONENTS
 # ============================================================================
 
-def has_string_light_capability(resource: Light) -> bool:
-    """Check if a light has string light capability with individual bulb control."""
-    try:
-        # Check device names for string light indicators
-        device_names_to_check = []
-        
-        if hasattr(resource, 'device_information') and resource.device_information:
-            if resource.device_information.name:
-                device_names_to_check.append(resource.device_information.name.lower())
-            if resource.device_information.default_name:
-                device_names_to_check.append(resource.device_information.default_name.lower())
-        
-        # Check if any of the device names indicate string lights
-        for device_name in device_names_to_check:
-            if 'string' in device_name and 'light' in device_name:
-                LOGGER.info(f"String light detected by name: {device_name}")
-                return True
-        
-        # Check if device has color-sequence-v2 functions which indicate framebuffer support
-        has_framebuffer = False
-        if hasattr(resource, 'instances') and resource.instances:
-            # Check for color-sequence-v2 functionClass in instances
-            if 'color-sequence-v2' in resource.instances:
-                LOGGER.info(f"String light detected by framebuffer capability: color-sequence-v2")
-                has_framebuffer = True
-        
-        # Additional technical checks for string light capabilities
-        
-        # Check device information for string light indicators
-        has_string_light_indicators = False
-        if hasattr(resource, 'device_information') and resource.device_information:
-            # Check default image for string light icon
-            if (hasattr(resource.device_information, 'default_image') and 
-                resource.device_information.default_image and 
-                'string' in resource.device_information.default_image.lower()):
-                LOGGER.info(f"String light detected by default image: {resource.device_information.default_image}")
-                has_string_light_indicators = True
-            
-            # Check default name for "String Lights" 
-            if (hasattr(resource.device_information, 'default_name') and 
-                resource.device_information.default_name and 
-                resource.device_information.default_name.lower() == 'string lights'):
-                LOGGER.info(f"String light detected by default name: {resource.device_information.default_name}")
-                has_string_light_indicators = True
-                
-            # Check model for Hampton Bay string light models
-            if (hasattr(resource.device_information, 'model') and 
-                resource.device_information.model and 
-                resource.device_information.model.startswith('HB-') and
-                'HS' in resource.device_information.model):
-                LOGGER.info(f"String light detected by model pattern: {resource.device_information.model}")
-                has_string_light_indicators = True
-        
-        # If we have framebuffer capability OR string light indicators, it's likely a string light
-        if has_framebuffer or has_string_light_indicators:
-            LOGGER.info(f"String light capability detected for device {resource.id} - framebuffer: {has_framebuffer}, indicators: {has_string_light_indicators}")
+# Lowercase default names used by string lights
+STRING_LIGHT_DEFAULT_NAMES: frozenset[str] = frozenset({"string lights"})
+# Hampton Bay string light models, e.g. HB-10521-HS
+STRING_LIGHT_MODEL_RE = re.compile(r"^HB-.*HS")
+# Words that must all appear in a device name for it to be a string light
+_STRING_NAME_TOKENS: tuple[str, ...] = ("string", "light")
+# Bulb counts for string light models that do not report one
+STRING_LIGHT_BULB_COUNTS: dict[str, int] = {"HB-10521-HS": 12}
+DEFAULT_STRING_LIGHT_BULB_COUNT = 12
+
+
+def _matches_string_light(
+    name: str, default_name: str, default_image: str, model: str, instances: dict
+) -> bool:
+    """Check the device details that identify a string light."""
+    default_name_lower = default_name.lower()
+
+    # Checks run cheapest first and stop at the first match
+
+    # Check default name for "String Lights"
+    if default_name_lower in STRING_LIGHT_DEFAULT_NAMES:
+        LOGGER.info("String light detected by default name: %s", default_name)
+        return True
+
+    # Check model for Hampton Bay string light models
+    if STRING_LIGHT_MODEL_RE.match(model):
+        LOGGER.info("String light detected by model pattern: %s", model)
+        return True
+
+    # Check if any of the device names indicate string lights
+    for device_name in (name.lower(), default_name_lower):
+        if all(token in device_name for token in _STRING_NAME_TOKENS):
+            LOGGER.info("String light detected by name: %s", device_name)
             return True
-        
-        return False
-    except Exception as e:
-        LOGGER.debug(f"Error checking string light capability: {e}")
-        return False
+
+    # Check if device has color-sequence-v2 functions which indicate framebuffer support
+    if 'color-sequence-v2' in instances:
+        LOGGER.info("String light detected by framebuffer capability: color-sequence-v2")
+        return True
+
+    # Check default image for string light icon
+    if 'string' in default_image.lower():
+        LOGGER.info("String light detected by default image: %s", default_image)
+        return True
+
+    return False
+
+
+def _read_string_light_details(resource: Light) -> tuple[str, str, str, str, dict]:
+    """Read the device details used to detect and size a string light.
+
+    :return: name, default name, default image, model, instances
+    """
+    dev_info = getattr(resource, "device_information", None)
+    return (
+        *get_device_names(resource),
+        getattr(dev_info, "default_image", None) or "",
+        getattr(dev_info, "model", None) or "",
+        getattr(resource, "instances", None) or {},
+    )
+
+
+# Instance state attributes that may hold the framebuffer, in lookup order
+FRAMEBUFFER_STATE_KEYS: tuple[str, ...] = (
+    "framebuffer",
+    "frameBuffer",
+    "colorSequence",
+    "bulbs",
+    "leds",
+)
+# Capability attributes that may hold the bulb count, in lookup order
+BULB_COUNT_ATTRS: tuple[str, ...] = (
+    "maxBulbs",
+    "max_bulbs",
+    "bulbCount",
+    "bulb_count",
+    "numBulbs",
+    "ledCount",
+    "led_count",
+)
+# Keys present in a single bulb's framebuffer entry
+BULB_DATA_KEYS: tuple[str, ...] = ("r", "g", "b", "colorBrightness", "whiteBrightness")
 
 
-def _extract_bulb_count_from_state(resource: Light) -> int:
+def _extract_bulb_count_from_state(instances: dict) -> int:
     """Try to extract bulb count from resource state/framebuffer data."""
-    try:
-        # Check if resource has color-sequence-v2 instance with current state
-        if hasattr(resource, 'instances') and resource.instances:
-            if 'color-sequence-v2' in resource.instances:
-                instance = resource.instances['color-sequence-v2']
-                
-                # Try to get current framebuffer data from the instance
-                if hasattr(instance, 'state') and instance.state:
-                    state = instance.state
-                    
-                    # Look for framebuffer data in various possible state keys
-                    framebuffer_keys = ['framebuffer', 'frameBuffer', 'colorSequence', 'bulbs', 'leds']
-                    
-                    for key in framebuffer_keys:
-                        if hasattr(state, key):
-                            framebuffer_data = getattr(state, key)
-                            if framebuffer_data and isinstance(framebuffer_data, (list, tuple)):
-                                bulb_count = len(framebuffer_data)
-                                LOGGER.info(f"Found {bulb_count} bulbs from state.{key}")
-                                return bulb_count
-                    
-                    # Also check if state has any dictionary attributes that might contain framebuffer
-                    if hasattr(state, '__dict__'):
-                        for attr_name, attr_value in state.__dict__.items():
-                            if isinstance(attr_value, (list, tuple)) and len(attr_value) > 0:
-                                # Check if this looks like bulb data (has color/brightness info)
-                                if len(attr_value) > 0 and isinstance(attr_value[0], dict):
-                                    first_item = attr_value[0]
-                                    if any(key in first_item for key in ['r', 'g', 'b', 'colorBrightness', 'whiteBrightness']):
-                                        bulb_count = len(attr_value)
-                                        LOGGER.info(f"Found {bulb_count} bulbs from state.{attr_name} (appears to be bulb data)")
-                                        return bulb_count
-        
-        # Check if resource itself has any framebuffer-like attributes
-        if hasattr(resource, '__dict__'):
-            for attr_name, attr_value in resource.__dict__.items():
-                if 'framebuffer' in attr_name.lower() or 'bulb' in attr_name.lower():
-                    if isinstance(attr_value, (list, tuple)) and len(attr_value) > 0:
-                        bulb_count = len(attr_value)
-                        LOGGER.info(f"Found {bulb_count} bulbs from resource.{attr_name}")
-                        return bulb_count
-        
+    # Only the color-sequence-v2 instance carries framebuffer state
+    if 'color-sequence-v2' not in instances:
         return 0
-        
-    except Exception as e:
-        LOGGER.debug(f"Error extracting bulb count from state: {e}")
+    state = getattr(instances['color-sequence-v2'], "state", None)
+    if not state:
         return 0
 
+    state_vars = getattr(state, "__dict__", None)
+    if state_vars is None:
+        state_vars = {
+            key: getattr(state, key, None)
+            for key in FRAMEBUFFER_STATE_KEYS
+        }
 
-def get_string_light_bulb_count(resource: Light) -> int:
-    """Get the number of individual bulbs in a string light."""
-    try:
-        LOGGER.info(f"Attempting to get bulb count for device {resource.id}")
-        
-        # Method 1: Try to extract from current state framebuffer data
-        # Check if the resource has any existing state with framebuffer data
-        bulb_count_from_state = _extract_bulb_count_from_state(resource)
-        if bulb_count_from_state > 0:
-            LOGGER.info(f"Found bulb count from state data: {bulb_count_from_state}")
-            return bulb_count_from_state
-        
-        # Method 2: Try to get bulb count from color-sequence-v2 instance capabilities
-        if hasattr(resource, 'instances') and resource.instances:
-            LOGGER.info(f"Available instances: {list(resource.instances.keys())}")
-            if 'color-sequence-v2' in resource.instances:
-                instance = resource.instances['color-sequence-v2']
-                LOGGER.info(f"Device has color-sequence-v2 capability, examining instance")
-                
-                # Try to get bulb count from instance attributes/capabilities
-                if hasattr(instance, 'capabilities') and instance.capabilities:
-                    capabilities = instance.capabilities
-                    if hasattr(capabilities, 'maxBulbs') or hasattr(capabilities, 'max_bulbs'):
-                        max_bulbs = getattr(capabilities, 'maxBulbs', None) or getattr(capabilities, 'max_bulbs', None)
-                        if max_bulbs and isinstance(max_bulbs, int) and max_bulbs > 0:
-                            LOGGER.info(f"Found bulb count from capabilities: {max_bulbs}")
-                            return max_bulbs
-                    
-                    # Check for other capability indicators
-                    if hasattr(capabilities, '__dict__'):
-                        for attr_name, attr_value in capabilities.__dict__.items():
-                            if 'bulb' in attr_name.lower() or 'led' in attr_name.lower() or 'count' in attr_name.lower():
-                                if isinstance(attr_value, int) and attr_value > 0:
-                                    LOGGER.info(f"Found potential bulb count from capabilities.{attr_name}: {attr_value}")
-                                    return attr_value
-                
-                # Try to get default framebuffer size from instance
-                if hasattr(instance, 'default_framebuffer_size'):
-                    size = instance.default_framebuffer_size
-                    if isinstance(size, int) and size > 0:
-                        LOGGER.info(f"Found bulb count from default_framebuffer_size: {size}")
-                        return size
-                
-        # Method 3: Check device model for known bulb counts
-        if hasattr(resource, 'device_information') and resource.device_information:
-            if (hasattr(resource.device_information, 'model') and 
-                resource.device_information.model):
-                model = resource.device_information.model
-                LOGGER.info(f"Checking model '{model}' for bulb count")
-                
-                # Hampton Bay HB-10521-HS is a 12-bulb string light
-                if model == 'HB-10521-HS':
-                    LOGGER.info(f"Known 12-bulb model: {model}")
-                    return 12
-        
-        # Default to 12 bulbs for Hampton Bay string lights if we can't determine exact count
-        default_bulb_count = 12
-        LOGGER.info(f"Using default bulb count of {default_bulb_count} for device {resource.id}")
-        return default_bulb_count
-        
-    except Exception as e:
-        LOGGER.debug(f"Error getting bulb count: {e}")
-        return 12
+    # Look for framebuffer data in various possible state keys
+    for key in FRAMEBUFFER_STATE_KEYS:
+        framebuffer_data = state_vars.get(key)
+        if framebuffer_data and isinstance(framebuffer_data, (list, tuple)):
+            bulb_count = len(framebuffer_data)
+            LOGGER.info("Found %s bulbs from state.%s", bulb_count, key)
+            return bulb_count
 
+    # Also check if state has any attributes that look like bulb data
+    for attr_name, attr_value in state_vars.items():
+        if (
+            isinstance(attr_value, (list, tuple))
+            and attr_value
+            and isinstance(attr_value[0], dict)
+            and any(key in attr_value[0] for key in BULB_DATA_KEYS)
+        ):
+            bulb_count = len(attr_value)
+            LOGGER.info(
+                "Found %s bulbs from state.%s (appears to be bulb data)",
+                bulb_count,
+                attr_name,
+            )
+            return bulb_count
 
-def should_create_string_light_bulbs(resource: Light) -> bool:
-    """Determine if we should create individual bulb entities for string lights."""
-    
-    LOGGER.info(f"Checking device {resource.id} for string light capability")
-    
-    if hasattr(resource, 'device_information') and resource.device_information:
-        LOGGER.info(f"  Device info - name: {resource.device_information.name}, default_name: {resource.device_information.default_name}")
-    
-    if hasattr(resource, 'instances') and resource.instances:
-        LOGGER.info(f"  Device instances: {list(resource.instances.keys())}")
-    
-    result = has_string_light_capability(resource)
+    return 0
+
+
+def _count_string_light_bulbs(device_id: str, model: str, instances: dict) -> int:
+    """Get the number of bulbs from the model and instances of a string light."""
+    LOGGER.info("Attempting to get bulb count for device %s", device_id)
+
+    # Method 1: Try to extract from current state framebuffer data
+    # Check if the resource has any existing state with framebuffer data
+    bulb_count_from_state = _extract_bulb_count_from_state(instances)
+    if bulb_count_from_state > 0:
+        LOGGER.info("Found bulb count from state data: %s", bulb_count_from_state)
+        return bulb_count_from_state
+
+    # Method 2: Try to get bulb count from color-sequence-v2 instance capabilities
+    if instances:
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("Available instances: %s", list(instances))
+        if 'color-sequence-v2' in instances:
+            instance = instances['color-sequence-v2']
+            LOGGER.info("Device has color-sequence-v2 capability, examining instance")
+
+            # Try to get bulb count from instance attributes/capabilities
+            capabilities = getattr(instance, 'capabilities', None)
+            if capabilities:
+                for attr_name in BULB_COUNT_ATTRS:
+                    attr_value = getattr(capabilities, attr_name, None)
+                    if isinstance(attr_value, int) and attr_value > 0:
+                        LOGGER.info(
+                            "Found bulb count from capabilities.%s: %s",
+                            attr_name,
+                            attr_value,
+                        )
+                        return attr_value
+
+            # Try to get default framebuffer size from instance
+            size = getattr(instance, 'default_framebuffer_size', None)
+            if isinstance(size, int) and size > 0:
+                LOGGER.info("Found bulb count from default_framebuffer_size: %s", size)
+                return size
+
+    # Method 3: Check device model for known bulb counts
+    if model:
+        LOGGER.info("Checking model '%s' for bulb count", model)
+
+        known_count = STRING_LIGHT_BULB_COUNTS.get(model)
+        if known_count:
+            LOGGER.info("Known %s-bulb model: %s", known_count, model)
+            return known_count
+
+    # Default to 12 bulbs for Hampton Bay string lights if we can't determine exact count
+    default_bulb_count = DEFAULT_STRING_LIGHT_BULB_COUNT
+    LOGGER.info(
+        "Using default bulb count of %s for device %s",
+        default_bulb_count,
+        device_id,
+    )
+    return default_bulb_count
+
+
+def get_string_light_info(
+    resource: Light, cache: dict[str, tuple[bool, int]]
+) -> tuple[bool, int]:
+    """Get if the light is a string light and its number of bulbs.
+
+    Only string lights are cached: a light that is not detected may not have
+    reported its full state yet, so it is checked again next time.
+
+    :param resource: Light from aioafero
+    :param cache: Earlier results by device id, kept for one config entry
+    :return: String light capability, bulb count (0 if not a string light)
+    """
+    info = cache.get(resource.id)
+    if info is not None:
+        return info
+
+    info = _inspect_string_light(resource)
+    if info[0]:
+        cache[resource.id] = info
+    return info
+
+
+def _inspect_string_light(resource: Light) -> tuple[bool, int]:
+    """Detect a string light and count its bulbs from one read of the resource.
+
+    :param resource: Light from aioafero
+    :return: String light capability, bulb count (0 if not a string light)
+    """
+    LOGGER.info("Checking device %s for string light capability", resource.id)
+    name, default_name, default_image, model, instances = (
+        _read_string_light_details(resource)
+    )
+    LOGGER.info("  Device info - name: %s, default_name: %s", name, default_name)
+    if instances and LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info("  Device instances: %s", list(instances))
+
+    bulb_count = 0
+    result = _matches_string_light(name, default_name, default_image, model, instances)
     if result:
-        bulb_count = get_string_light_bulb_count(resource)
-        LOGGER.info(f"Device {resource.id} has string light capability with {bulb_count} individual bulbs")
+        bulb_count = _count_string_light_bulbs(resource.id, model, instances)
+        LOGGER.info(
+            "Device %s has string light capability with %s individual bulbs",
+            resource.id,
+            bulb_count,
+        )
     else:
-        LOGGER.info(f"Device {resource.id} does not have string light capability")
-    
-    return result
+        LOGGER.info("Device %s does not have string light capability", resource.id)
+
+    return result, bulb_count
+
+
+# Color temperature range of a string light bulb
+STRING_LIGHT_MIN_COLOR_TEMP = 2700
+STRING_LIGHT_MAX_COLOR_TEMP = 6500
+
+
+class BulbState(NamedTuple):
+    """Color and brightness of a single string light bulb."""
+
+    r: int = 255
+    g: int = 255
+    b: int = 255
+    color_brightness: int = 100
+    white_brightness: int = 0
+    cct: int = 3500
+
+
+# Framebuffer keys and the BulbState field they map to
+BULB_STATE_FIELDS: dict[str, str] = {
+    "r": "r",
+    "g": "g",
+    "b": "b",
+    "colorBrightness": "color_brightness",
+    "whiteBrightness": "white_brightness",
+    "cct": "cct",
+}
+
+
+def merge_bulb_state(state: BulbState, bulb_data: dict) -> BulbState:
+    """Apply framebuffer values to a bulb state.
+
+    :param state: Current state of the bulb
+    :param bulb_data: Framebuffer entry, or partial entry, for the bulb
+    :return: New state with the known framebuffer keys applied
+    """
+    return state._replace(
+        **{
+            BULB_STATE_FIELDS[key]: value
+            for key, value in bulb_data.items()
+            if key in BULB_STATE_FIELDS
+        }
+    )
 
 
 class HubspaceStringLightBulb(HubspaceBaseEntity, LightEntity):
     """Representation of an individual bulb in a string light."""
+
+    # _attr_* fields are left out as Home Assistant wraps them in properties
+    __slots__ = (
+        "_bulb_index",
+        "_current_bulb_state",
+        "_derived",
+        "_is_on",
+        "_shared_context",
+        "_total_bulbs",
+    )
     
     def __init__(
         self,
@@ -592,52 +869,98 @@ class HubspaceStringLightBulb(HubspaceBaseEntity, LightEntity):
         # then subsequent calls would overwrite the previous bulb state. 
         self._shared_context = get_shared_context(resource, bridge, total_bulbs)
         
-        # String light bulbs support RGB, brightness, and color temperature
-        supported_color_modes = {ColorMode.ONOFF, ColorMode.RGB, ColorMode.BRIGHTNESS}
-        if self.resource.supports_color_temperature:
-            supported_color_modes.add(ColorMode.COLOR_TEMP)
-            
-        self._attr_supported_color_modes = filter_supported_color_modes(supported_color_modes)
+        # String light bulbs support RGB, brightness, and color temperature.
+        # Every bulb of the device shares the same filtered set.
+        self._attr_supported_color_modes = get_supported_color_modes(
+            True, self.resource.supports_color_temperature, True
+        )
+        if ColorMode.COLOR_TEMP in self._attr_supported_color_modes:
+            self._attr_min_color_temp_kelvin = STRING_LIGHT_MIN_COLOR_TEMP
+            self._attr_max_color_temp_kelvin = STRING_LIGHT_MAX_COLOR_TEMP
+        else:
+            self._attr_min_color_temp_kelvin = None
+            self._attr_max_color_temp_kelvin = None
         
         # Cache current bulb state
-        self._current_bulb_state = {
-            'r': 255, 'g': 255, 'b': 255,
-            'colorBrightness': 100,
-            'whiteBrightness': 0,
-            'cct': 3500
-        }
+        self._current_bulb_state: BulbState
+        self._derived: tuple[int | None, ColorMode]
+        self._set_bulb_state(BulbState())
         self._is_on = False
         
-        LOGGER.info(f"Created string light bulb {bulb_index + 1} of {total_bulbs} for device {resource.id}")
+        LOGGER.debug(
+            "Created string light bulb %s of %s for device %s",
+            bulb_index + 1,
+            total_bulbs,
+            resource.id,
+        )
     
+    def _set_bulb_state(self, state: BulbState) -> None:
+        """Store the bulb state along with the brightness and color mode it gives."""
+        self._current_bulb_state = state
+        brightness = max(state.color_brightness, state.white_brightness)
+        supported = self._attr_supported_color_modes
+        if state.color_brightness > 0 and ColorMode.RGB in supported:
+            color_mode = ColorMode.RGB
+        elif state.white_brightness > 0 and ColorMode.COLOR_TEMP in supported:
+            color_mode = ColorMode.COLOR_TEMP
+        elif ColorMode.BRIGHTNESS in supported:
+            color_mode = ColorMode.BRIGHTNESS
+        else:
+            color_mode = ColorMode.ONOFF
+        self._derived = (
+            value_to_brightness((1, 100), brightness) if brightness > 0 else None,
+            color_mode,
+        )
+
     async def _update_bulb_state_from_resource(self) -> None:
         """Update cached bulb state from the shared framebuffer context."""
         try:
             # Check if device power state and refresh framebuffer if needed
             power_state = self._shared_context.get_power_state()
-            LOGGER.info(f"Bulb {self._bulb_index} updating state, device power state: {power_state}")
+            LOGGER.debug(
+                "Bulb %s updating state, device power state: %s",
+                self._bulb_index,
+                power_state,
+            )
             
-            if power_state == "on":
-                # Try to refresh framebuffer from device to get current colors
             if power_state == "on":
                 # Try to refresh framebuffer from device to get current colors
                 refresh_success = await self._shared_context.refresh_framebuffer_from_device()
-                LOGGER.info(f"Bulb {self._bulb_index} framebuffer refresh result: {refresh_success}")
+                LOGGER.debug(
+                    "Bulb %s framebuffer refresh result: %s",
+                    self._bulb_index,
+                    refresh_success,
+                )
                 
                 # Even if refresh failed, check if we have cached framebuffer data
                 if not refresh_success:
-                    LOGGER.warning(f"Bulb {self._bulb_index} refresh failed, checking for cached framebuffer data")
-            
+                    LOGGER.warning(
+                        "Bulb %s refresh failed, checking for cached framebuffer data",
+                        self._bulb_index,
+                    )
+        except Exception as e:
+            LOGGER.error("Error updating bulb %s state: %s", self._bulb_index, e)
+            # Default to off if we can't determine state
+            self._is_on = False
+            return
+        self._apply_shared_state()
+
+    def _apply_shared_state(self) -> None:
+        """Update cached bulb state from the shared framebuffer context."""
+        try:
+            power_state = self._shared_context.get_power_state()
+
             # Use shared context to get current framebuffer - this includes refreshed data
             current_framebuffer = self._shared_context.get_current_framebuffer()
-            if current_framebuffer and len(current_framebuffer) > self._bulb_index:                LOGGER.info(f"Bulb {self._bulb_index} framebuffer data: {current_framebuffer[self._bulb_index]}")
-            
             if current_framebuffer and self._bulb_index < len(current_framebuffer):
                 bulb_data = current_framebuffer[self._bulb_index]
+                LOGGER.debug(
+                    "Bulb %s framebuffer data: %s", self._bulb_index, bulb_data
+                )
                 if isinstance(bulb_data, dict):
                     # Store previous state for comparison
-                    old_state = dict(self._current_bulb_state)
-                    self._current_bulb_state.update(bulb_data)
+                    old_state = self._current_bulb_state
+                    self._set_bulb_state(merge_bulb_state(old_state, bulb_data))
                     
                     # Determine if bulb is "on" based on brightness values
                     color_brightness = bulb_data.get('colorBrightness', 0)
@@ -645,14 +968,15 @@ class HubspaceStringLightBulb(HubspaceBaseEntity, LightEntity):
                     self._is_on = (color_brightness > 0 or white_brightness > 0)
                     
                     # Log state change if significant
-                    if (old_state.get('r') != bulb_data.get('r') or 
-                        old_state.get('g') != bulb_data.get('g') or 
-                        old_state.get('b') != bulb_data.get('b') or
-                        old_state.get('colorBrightness') != color_brightness or
-                        old_state.get('whiteBrightness') != white_brightness):
-                        LOGGER.info(f"Bulb {self._bulb_index} state changed: on={self._is_on}, "
-                                f"RGB=({bulb_data.get('r', 0)}, {bulb_data.get('g', 0)}, {bulb_data.get('b', 0)}), "
-                                f"colorBrightness={color_brightness}, whiteBrightness={white_brightness}")
+                    state = self._current_bulb_state
+                    if state != old_state and LOGGER.isEnabledFor(logging.DEBUG):
+                        LOGGER.debug(
+                            "Bulb %s state changed: on=%s, RGB=(%s, %s, %s), "
+                            "colorBrightness=%s, whiteBrightness=%s, cct=%s",
+                            self._bulb_index,
+                            self._is_on,
+                            *state,
+                        )
                     
                     return
             
@@ -661,60 +985,41 @@ class HubspaceStringLightBulb(HubspaceBaseEntity, LightEntity):
                 # Device is on but we don't have framebuffer data yet - set default color
                 self._is_on = True
                 # Provide default color data so bulbs aren't just "on" with no color
-                self._current_bulb_state.update({
-                    'r': 255, 'g': 255, 'b': 255,
-                    'colorBrightness': 50,
-                    'whiteBrightness': 0
-                })
-                LOGGER.warning(f"Bulb {self._bulb_index} no framebuffer data - using default white color")
+                self._set_bulb_state(
+                    self._current_bulb_state._replace(
+                        r=255, g=255, b=255, color_brightness=50, white_brightness=0
+                    )
+                )
+                LOGGER.warning(
+                    "Bulb %s no framebuffer data - using default white color",
+                    self._bulb_index,
+                )
             else:
                 self._is_on = False
-                LOGGER.info(f"Bulb {self._bulb_index} device is off")
+                LOGGER.debug("Bulb %s device is off", self._bulb_index)
                 
         except Exception as e:
-            LOGGER.error(f"Error updating bulb {self._bulb_index} state: {e}")
+            LOGGER.error("Error updating bulb %s state: %s", self._bulb_index, e)
             # Default to off if we can't determine state
             self._is_on = False
     
     async def async_added_to_hass(self) -> None:
         """Subscribe to updates when entity is added to hass."""
         await super().async_added_to_hass()
-        LOGGER.info(f"Bulb {self._bulb_index} being added to Home Assistant")
+        LOGGER.debug("Bulb %s being added to Home Assistant", self._bulb_index)
         
         # Initialize bulb state from device
         await self._update_bulb_state_from_resource()
         
-        # Force immediate state write to Home Assistant        self.async_write_ha_state()
-        
-        # Set up a periodic state refresh to keep in sync with the device
-        # This helps ensure HomeAssistant reflects actual device state
-        async def periodic_update():
-            """Periodically update state from device."""
-            try:
-                await self._update_bulb_state_from_resource()
-                self.async_write_ha_state()
-            except Exception as e:
-                LOGGER.debug(f"Error in periodic update for bulb {self._bulb_index}: {e}")
-        
-        # Schedule periodic updates every 30 seconds
-        # Use Home Assistant's built-in track_time_interval instead of infinite loop
-        from homeassistant.helpers.event import async_track_time_interval
-        from datetime import timedelta
-        
-        async def periodic_update_callback(now):
-            """Periodic update callback for Home Assistant scheduler."""
-            try:
-                await self._update_bulb_state_from_resource()
-                self.async_write_ha_state()
-            except Exception as e:
-                LOGGER.debug(f"Error in periodic update for bulb {self._bulb_index}: {e}")
-        
-        # Schedule periodic updates every 60 seconds using HA's scheduler
+        # Force immediate state write to Home Assistant
+        self.async_write_ha_state()
+
+        # Later changes arrive through the shared context, which refreshes
+        # once per device update and then notifies every bulb
         self.async_on_remove(
-            async_track_time_interval(
-                self.hass, periodic_update_callback, timedelta(seconds=60)
-            )
+            self._shared_context.register_listener(self._handle_shared_update)
         )
+
     @property
     def is_on(self) -> bool:
         """Return if the individual bulb is on."""
@@ -724,113 +1029,76 @@ class HubspaceStringLightBulb(HubspaceBaseEntity, LightEntity):
     def brightness(self) -> int | None:
         """Return the brightness of this bulb."""
         # Use color brightness if available, otherwise white brightness
-        color_brightness = self._current_bulb_state.get('colorBrightness', 0)
-        white_brightness = self._current_bulb_state.get('whiteBrightness', 0)
-        brightness = max(color_brightness, white_brightness)
-        return value_to_brightness((1, 100), brightness) if brightness > 0 else None
+        return self._derived[0]
     
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the RGB color of this bulb."""
-        if self._current_bulb_state.get('colorBrightness', 0) > 0:
-            return (
-                self._current_bulb_state.get('r', 255),
-                self._current_bulb_state.get('g', 255),
-                self._current_bulb_state.get('b', 255)
-            )
+        state = self._current_bulb_state
+        if state.color_brightness > 0:
+            return state.r, state.g, state.b
         return None
     
     @property
     def color_temp_kelvin(self) -> int | None:
         """Return the color temperature of this bulb."""
-        if self._current_bulb_state.get('whiteBrightness', 0) > 0:
-            return self._current_bulb_state.get('cct', 3500)
+        state = self._current_bulb_state
+        if state.white_brightness > 0:
+            return state.cct
         return None
     
     @property
     def color_mode(self) -> ColorMode:
         """Return the current color mode."""
-        color_brightness = self._current_bulb_state.get('colorBrightness', 0)
-        white_brightness = self._current_bulb_state.get('whiteBrightness', 0)
-        
-        if color_brightness > 0 and ColorMode.RGB in self._attr_supported_color_modes:
-            return ColorMode.RGB
-        elif white_brightness > 0 and ColorMode.COLOR_TEMP in self._attr_supported_color_modes:
-            return ColorMode.COLOR_TEMP
-        elif ColorMode.BRIGHTNESS in self._attr_supported_color_modes:
-            return ColorMode.BRIGHTNESS
-        else:
-            return ColorMode.ONOFF
-    
-    @property
-    def max_color_temp_kelvin(self) -> int | None:
-        """Return the max color temperature."""
-        return 6500 if ColorMode.COLOR_TEMP in self._attr_supported_color_modes else None
-    
-    @property
-    def min_color_temp_kelvin(self) -> int | None:
-        """Return the min color temperature."""
-        return 2700 if ColorMode.COLOR_TEMP in self._attr_supported_color_modes else None
+        return self._derived[1]
     
     @update_decorator
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on this individual bulb using SharedFramebufferContext."""
-        bulb_updates = {}
-        
         # Ensure string light is powered on first
         power_state = self._shared_context.get_power_state()
         if power_state != "on":
-            LOGGER.info(f"Turning on string light device {self.resource.id}")
+            LOGGER.info("Turning on string light device %s", self.resource.id)
             await self._shared_context.set_power_state("on")
         
-        # Handle brightness
-        if ATTR_BRIGHTNESS in kwargs:
-            brightness = int(brightness_to_value((1, 100), kwargs[ATTR_BRIGHTNESS]))
-            # Check if we're in color or white mode
-            if ATTR_RGB_COLOR in kwargs:
-                bulb_updates['colorBrightness'] = brightness
-                bulb_updates['whiteBrightness'] = 0
-            elif ATTR_COLOR_TEMP_KELVIN in kwargs:
-                bulb_updates['whiteBrightness'] = brightness
-                bulb_updates['colorBrightness'] = 0
-            else:
-                # Default to color brightness
-                bulb_updates['colorBrightness'] = brightness
-        
-        # Handle RGB color
+        brightness = (
+            to_device_brightness(kwargs[ATTR_BRIGHTNESS])
+            if ATTR_BRIGHTNESS in kwargs
+            else 100
+        )
         if ATTR_RGB_COLOR in kwargs:
             r, g, b = kwargs[ATTR_RGB_COLOR]
-            bulb_updates.update({
+            bulb_updates = {
                 'r': r, 'g': g, 'b': b,
-                'colorBrightness': bulb_updates.get('colorBrightness', 100),
-                'whiteBrightness': 0
-            })
-        
-        # Handle color temperature
-        if ATTR_COLOR_TEMP_KELVIN in kwargs:
-            temp_k = kwargs[ATTR_COLOR_TEMP_KELVIN]
-            bulb_updates.update({
-                'cct': temp_k,
-                'whiteBrightness': bulb_updates.get('whiteBrightness', 100),
+                'colorBrightness': brightness,
+                'whiteBrightness': 0,
+            }
+        elif ATTR_COLOR_TEMP_KELVIN in kwargs:
+            bulb_updates = {
+                'cct': kwargs[ATTR_COLOR_TEMP_KELVIN],
+                'whiteBrightness': brightness,
                 'colorBrightness': 0,
-                'r': 0, 'g': 0, 'b': 0
-            })
-        
-        # If no specific parameters, just turn on with current color
-        if not bulb_updates:
-            bulb_updates = {'colorBrightness': 100}
+                'r': 0, 'g': 0, 'b': 0,
+            }
+        else:
+            # Without a color, turn on with the current color
+            bulb_updates = {'colorBrightness': brightness}
         
         # Use shared context to update this bulb - preserves other bulb state
         success = await self._shared_context.update_framebuffer(self._bulb_index, bulb_updates)
         
         if success:
             # Update our local cache
-            self._current_bulb_state.update(bulb_updates)
-            self._is_on = (self._current_bulb_state.get('colorBrightness', 0) > 0 or 
-                          self._current_bulb_state.get('whiteBrightness', 0) > 0)
-            LOGGER.info(f"Successfully turned on bulb {self._bulb_index} with updates: {bulb_updates}")
+            state = merge_bulb_state(self._current_bulb_state, bulb_updates)
+            self._set_bulb_state(state)
+            self._is_on = state.color_brightness > 0 or state.white_brightness > 0
+            LOGGER.debug(
+                "Successfully turned on bulb %s with updates: %s",
+                self._bulb_index,
+                bulb_updates,
+            )
         else:
-            LOGGER.error(f"Failed to turn on bulb {self._bulb_index}")
+            LOGGER.error("Failed to turn on bulb %s", self._bulb_index)
     
     @update_decorator
     async def async_turn_off(self, **kwargs) -> None:
@@ -845,26 +1113,25 @@ class HubspaceStringLightBulb(HubspaceBaseEntity, LightEntity):
         
         if success:
             # Update our local cache
-            self._current_bulb_state.update(bulb_updates)
+            self._set_bulb_state(
+                merge_bulb_state(self._current_bulb_state, bulb_updates)
+            )
             self._is_on = False
-            LOGGER.info(f"Successfully turned off bulb {self._bulb_index}")
+            LOGGER.debug("Successfully turned off bulb %s", self._bulb_index)
         else:
-            LOGGER.error(f"Failed to turn off bulb {self._bulb_index}")
+            LOGGER.error("Failed to turn off bulb %s", self._bulb_index)
     
     @callback
     def on_update(self) -> None:
         """Called when the parent device is updated - refresh our state."""
-        # Trigger an async state update when the device changes
-        # This ensures we get the latest framebuffer when device state changes
-        self.hass.async_create_task(self._handle_device_update())
+        # Every bulb of the device gets this call, the context refreshes once
+        self._shared_context.request_refresh(self.hass)
 
-    async def _handle_device_update(self) -> None:
-        """Handle device update event asynchronously."""
-        try:
-            await self._update_bulb_state_from_resource()
-            self.async_write_ha_state()
-        except Exception as e:
-            LOGGER.debug(f"Error handling device update for bulb {self._bulb_index}: {e}")
+    @callback
+    def _handle_shared_update(self) -> None:
+        """Write the bulb state after the shared framebuffer was refreshed."""
+        self._apply_shared_state()
+        self.async_write_ha_state()
 
 
 async def async_setup_entry(
@@ -876,47 +1143,68 @@ async def async_setup_entry(
     bridge: HubspaceBridge = hass.data[DOMAIN][config_entry.entry_id]
     api: AferoBridgeV1 = bridge.api
     controller: LightController = api.lights
-    make_entity = partial(HubspaceLight, bridge, controller)
+    # Detection results for this entry, dropped with it when it is unloaded
+    dual_mode_ids: set[str] = set()
+    string_light_info: dict[str, tuple[bool, int]] = {}
 
-    def make_entities(resource: Light) -> list[HubspaceLight]:
+    def make_entities(resource: Light) -> Iterator[LightEntity]:
         """Create light entity(ies) based on device capabilities."""
+        entities: tuple[LightEntity, ...] = ()
         try:
             # Try enhanced functionality first
-            if should_create_dual_lights(resource):
-                LOGGER.info(f"Creating dual-mode lights for device {resource.id}")
-                return [
+            if should_create_dual_lights(resource, dual_mode_ids):
+                LOGGER.info("Creating dual-mode lights for device %s", resource.id)
+                entities = (
                     HubspaceColorLight(bridge, controller, resource),
-                    HubspaceWhiteLight(bridge, controller, resource)
-                ]
-            
-            if should_create_string_light_bulbs(resource):
-                LOGGER.info(f"Creating string light bulbs for device {resource.id}")
-                bulb_count = get_string_light_bulb_count(resource)
-                return [
-                    HubspaceStringLightBulb(bridge, controller, resource, i, bulb_count)
-                    for i in range(bulb_count)
-                ]
-
+                    HubspaceWhiteLight(bridge, controller, resource),
+                )
+            else:
+                is_string_light, bulb_count = get_string_light_info(
+                    resource, string_light_info
+                )
+                if is_string_light:
+                    LOGGER.info("Creating string light bulbs for device %s", resource.id)
+                    entities = tuple(
+                        HubspaceStringLightBulb(bridge, controller, resource, i, bulb_count)
+                        for i in range(bulb_count)
+                    )
         except Exception as e:
             # If enhanced functionality fails, fall back to original behavior
-            LOGGER.warning(f"Enhanced light functionality failed for device {resource.id}, using standard light: {e}")
-        
+            LOGGER.warning(
+                "Enhanced light functionality failed for device %s, using standard light: %s",
+                resource.id,
+                e,
+            )
+
+        if entities:
+            yield from entities
+            return
+
         # Default: use original single light entity (preserves original behavior)
-        return [make_entity(resource)]
+        yield HubspaceLight(bridge, controller, resource)
 
     @callback
     def async_add_entity(event_type: EventType, resource: Light) -> None:
         """Add an entity or entities."""
-        entities = make_entities(resource)
-        async_add_entities(entities)
+        async_add_entities(make_entities(resource))
+
+    @callback
+    def async_forget_resource(event_type: EventType, resource: Light) -> None:
+        """Drop cached details of a removed light."""
+        dual_mode_ids.discard(resource.id)
+        string_light_info.pop(resource.id, None)
 
     # add all current items in controller using new logic
-    all_entities = []
-    for entity in controller:
-        all_entities.extend(make_entities(entity))
-    async_add_entities(all_entities)
+    async_add_entities(
+        chain.from_iterable(make_entities(entity) for entity in controller)
+    )
     
     # register listener for new entities
     config_entry.async_on_unload(
         controller.subscribe(async_add_entity, event_filter=EventType.RESOURCE_ADDED)
     )
+    config_entry.async_on_unload(
+        controller.subscribe(
+            async_forget_resource, event_filter=EventType.RESOURCE_DELETED
+        )
+    )
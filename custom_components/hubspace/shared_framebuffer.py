@@ -9,13 +9,71 @@ an authoritative cache of the framebuffer data.
 import logging
 import time
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 
 from aioafero.v1.models import Light
+from homeassistant.core import HomeAssistant
 from .bridge import HubspaceBridge
 
 LOGGER = logging.getLogger(__name__)
 
+# Seconds during which a framebuffer refresh is shared by every bulb
+REFRESH_DEBOUNCE = 0.5
+# Seconds to wait for more bulb updates before sending the framebuffer
+FRAMEBUFFER_WRITE_WINDOW = 0.05
+
+# Framebuffer entry of a bulb that is off
+DEFAULT_BULB: dict[str, int] = {
+    'r': 255, 'g': 255, 'b': 255,
+    'colorBrightness': 0,
+    'whiteBrightness': 0,
+    'cct': 3500
+}
+# Fixed settings of the custom sequence that carries the framebuffer
+SEQUENCE_TEMPLATE: dict[str, Any] = {
+    "sequenceFlags": 0,
+    "brightnessSpeed": 50,
+    "motionSpeed": 48,
+    "motionEffect": 0,
+    "brightnessEffect": 0,
+    "headerFlags": 128,
+    "frameBuffer": None,
+    "id": 0,
+    "version": 1,
+    "brightnessDepth": 100,
+}
+# State that stores the custom sequence on the device
+SEQUENCE_STATE: dict[str, str] = {
+    "functionClass": "color-sequence-v2",
+    "functionInstance": "custom-1",
+}
+# States that switch the device to individual mode using the custom sequence
+INDIVIDUAL_MODE_STATES: tuple[dict[str, str], ...] = (
+    {"functionClass": "color-mode", "value": "individual"},
+    {
+        "functionClass": "color-individual",
+        "functionInstance": "custom",
+        "value": "custom-1",
+    },
+)
+
+
+def _nested_get(data: dict, *keys: str) -> Any:
+    """Follow keys through nested dicts, returning None where a level is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def clone_framebuffer(framebuffer: list[dict]) -> list[dict]:
+    """Copy a framebuffer so its bulbs can be changed independently.
+
+    Bulb entries only hold ints, so copying each entry is a full copy.
+    """
+    return [bulb.copy() for bulb in framebuffer]
+
 
 class SharedFramebufferContext:
     """
@@ -32,76 +90,164 @@ class SharedFramebufferContext:
         # Maintain our own authoritative framebuffer state
         self._cached_framebuffer: Optional[list[dict]] = None
         self._framebuffer_initialized = False
-        LOGGER.info(f"SharedFramebufferContext initialized for device {resource.id} with {expected_bulb_count} bulbs")
+        # color-sequence-v2 keys of the instances they were found in
+        self._sequence_instance_keys: list = []
+        self._scanned_instances: Optional[dict] = None
+        self._scanned_instance_count = 0
+        # Set once the device has been switched to our custom sequence
+        self._individual_mode_sent = False
+        # Bulbs refresh together on every device update, so they share one read
+        self._refresh_lock = asyncio.Lock()
+        self._last_refresh: float = -REFRESH_DEBOUNCE
+        self._last_refresh_result = False
+        self._last_read_attempt: float = -REFRESH_DEBOUNCE
+        self._power_state: Optional[str] = None
+        self._power_state_read: float = -REFRESH_DEBOUNCE
+        # Bulb updates waiting to be sent and the result their callers await.
+        # The pending framebuffer is a copy of the cached one it was made from
+        # and only replaces the cache once it has been sent.
+        self._pending_framebuffer: Optional[list[dict]] = None
+        self._pending_base: Optional[list[dict]] = None
+        self._pending_updates: dict[int, dict] = {}
+        self._pending_write: Optional[asyncio.Future] = None
+        # Bulb entities notified after each refresh triggered by a device update
+        self._listeners: list[Callable[[], None]] = []
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_requested = False
+        LOGGER.info(
+            "SharedFramebufferContext initialized for device %s with %s bulbs",
+            resource.id,
+            expected_bulb_count,
+        )
 
     def _read_framebuffer_from_resource(self) -> Optional[list[dict]]:
         """Read framebuffer directly from the resource's current state."""
         try:
             # Check color mode first
             color_mode = getattr(self.resource.color_mode, 'mode', None)
-            LOGGER.debug(f"Current color mode: {color_mode}")
+            LOGGER.debug("Current color mode: %s", color_mode)
             
             # Debug: Log all available instances
-            if hasattr(self.resource, 'instances') and self.resource.instances:
-                LOGGER.debug(f"Available resource instances: {list(self.resource.instances.keys())}")
-                for k, v in self.resource.instances.items():
-                    LOGGER.debug(f"  Instance {k}: {type(v)} = {v}")
+            instances = getattr(self.resource, 'instances', None)
+            if instances:
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug("Available resource instances: %s", list(instances))
+                    for k, v in instances.items():
+                        LOGGER.debug("  Instance %s: %s = %s", k, type(v), v)
             else:
                 LOGGER.debug("No instances found in resource")
                 return None
             
             # Look for any color-sequence-v2 instances regardless of color mode
-            sequence_instances = []
-            for k, v in self.resource.instances.items():
-                if isinstance(k, tuple) and k[0] == 'color-sequence-v2':
-                    sequence_instances.append((k, v))
+            sequence_instances = [
+                (k, instances[k]) for k in self._get_sequence_instance_keys(instances)
+            ]
             
-            LOGGER.debug(f"Found {len(sequence_instances)} color-sequence-v2 instances")
+            LOGGER.debug("Found %s color-sequence-v2 instances", len(sequence_instances))
             
             # Try to extract framebuffer from any available sequence
             for k, seq_data in sequence_instances:
-                LOGGER.debug(f"Checking sequence instance {k}")
+                LOGGER.debug("Checking sequence instance %s", k)
                 if isinstance(seq_data, dict):
-                    framebuffer = None
-                    
-                    # Path 1: seq_data['color-sequence-v2']['frameBuffer']['framebuffer']
-                    if 'color-sequence-v2' in seq_data:
-                        cs2_data = seq_data['color-sequence-v2']
-                        if isinstance(cs2_data, dict) and 'frameBuffer' in cs2_data:
-                            fb_data = cs2_data['frameBuffer']
-                            if isinstance(fb_data, dict) and 'framebuffer' in fb_data:
-                                framebuffer = fb_data['framebuffer']
-                    
-                    # Path 2: seq_data['frameBuffer']['framebuffer'] (direct)
-                    if not framebuffer and 'frameBuffer' in seq_data:
-                        fb_data = seq_data['frameBuffer']
-                        if isinstance(fb_data, dict) and 'framebuffer' in fb_data:
-                            framebuffer = fb_data['framebuffer']
-                    
-                    # Path 3: seq_data['framebuffer'] (most direct)
-                    if not framebuffer and 'framebuffer' in seq_data:
-                        framebuffer = seq_data['framebuffer']
+                    framebuffer = (
+                        # Path 1: seq_data['color-sequence-v2']['frameBuffer']['framebuffer']
+                        _nested_get(seq_data, 'color-sequence-v2', 'frameBuffer', 'framebuffer')
+                        # Path 2: seq_data['frameBuffer']['framebuffer'] (direct)
+                        or _nested_get(seq_data, 'frameBuffer', 'framebuffer')
+                        # Path 3: seq_data['framebuffer'] (most direct)
+                        or seq_data.get('framebuffer')
+                    )
                     
                     if framebuffer and isinstance(framebuffer, list):
-                        LOGGER.debug(f"Found framebuffer with {len(framebuffer)} bulbs")
-                        return [dict(b) for b in framebuffer]  # Deep copy
+                        LOGGER.debug("Found framebuffer with %s bulbs", len(framebuffer))
+                        # Read-only: _stage_bulb_update clones before mutating
+                        return framebuffer
                     else:
-                        LOGGER.debug(f"No valid framebuffer found in sequence {k}")
+                        LOGGER.debug("No valid framebuffer found in sequence %s", k)
             
             LOGGER.debug("No framebuffer found in any sequence instance")
             return None
             
         except Exception as e:
-            LOGGER.error(f"Error reading framebuffer from resource: {e}")
+            LOGGER.error("Error reading framebuffer from resource: %s", e)
             return None
 
+    def _get_sequence_instance_keys(self, instances: dict) -> list:
+        """
+        Get the keys of the color-sequence-v2 instances.
+        The keys only change when the instances are replaced or extended,
+        so the scan is kept until then.
+        """
+        if (
+            instances is not self._scanned_instances
+            or len(instances) != self._scanned_instance_count
+        ):
+            self._sequence_instance_keys = [
+                k for k in instances
+                if isinstance(k, tuple) and k[0] == 'color-sequence-v2'
+            ]
+            self._scanned_instances = instances
+            self._scanned_instance_count = len(instances)
+        return self._sequence_instance_keys
+
     async def refresh_framebuffer_from_device(self) -> bool:
         """
         Actively refresh the framebuffer state from the device.
-        This forces a re-read of the current device state.
+        This forces a re-read of the current device state. Calls made while a
+        refresh is running, or within REFRESH_DEBOUNCE seconds of the last one,
+        share its result.
+        """
+        async with self._refresh_lock:
+            if time.monotonic() - self._last_refresh < REFRESH_DEBOUNCE:
+                return self._last_refresh_result
+            result = await self._refresh_framebuffer()
+            self._last_refresh = time.monotonic()
+            self._last_refresh_result = result
+            return result
+
+    def register_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener after every device update, return a function to stop it."""
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    def request_refresh(self, hass: HomeAssistant) -> asyncio.Task:
         """
+        Refresh the framebuffer once and then notify all listeners.
+        Requests made while a refresh is running are merged into one more
+        refresh after it. Returns the task doing the refresh.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_requested = True
+        else:
+            self._refresh_task = hass.async_create_task(self._async_refresh_listeners())
+        return self._refresh_task
+
+    async def _async_refresh_listeners(self) -> None:
+        """Refresh from the updated resource and notify the listeners."""
+        self._refresh_requested = True
+        while self._refresh_requested:
+            self._refresh_requested = False
+            # The update may have changed the power state, so read it again
+            self._power_state_read = -REFRESH_DEBOUNCE
+            if self.get_power_state() == "on":
+                async with self._refresh_lock:
+                    self._last_refresh_result = await self._refresh_framebuffer()
+                    self._last_refresh = time.monotonic()
+            for listener in list(self._listeners):
+                # One failing bulb must not keep the others from updating
+                try:
+                    listener()
+                except Exception:
+                    LOGGER.exception("Error notifying listener of device %s", self.resource.id)
+
+    async def _refresh_framebuffer(self) -> bool:
+        """Re-read the framebuffer from the resource into the cache."""
         try:
-            LOGGER.info(f"Refreshing framebuffer from device {self.resource.id}")
+            LOGGER.info("Refreshing framebuffer from device %s", self.resource.id)
             
             # Clear our cached framebuffer to force a fresh read
             old_framebuffer = self._cached_framebuffer
@@ -113,167 +259,245 @@ class SharedFramebufferContext:
             if fresh_framebuffer:
                 self._cached_framebuffer = fresh_framebuffer
                 self._framebuffer_initialized = True
-                LOGGER.info(f"Successfully refreshed framebuffer with {len(fresh_framebuffer)} bulbs:")
-                for i, bulb in enumerate(fresh_framebuffer):
-                    color_brightness = bulb.get('colorBrightness', 0)
-                    white_brightness = bulb.get('whiteBrightness', 0)
-                    r, g, b = bulb.get('r', 0), bulb.get('g', 0), bulb.get('b', 0)
-                    LOGGER.info(f"  Bulb {i}: RGB=({r},{g},{b}), ColorBrightness={color_brightness}, WhiteBrightness={white_brightness}")
+                LOGGER.info("Successfully refreshed framebuffer with %s bulbs:", len(fresh_framebuffer))
+                if LOGGER.isEnabledFor(logging.INFO):
+                    for i, bulb in enumerate(fresh_framebuffer):
+                        get = bulb.get
+                        LOGGER.info(
+                            "  Bulb %s: RGB=(%s,%s,%s), ColorBrightness=%s, WhiteBrightness=%s",
+                            i,
+                            get('r', 0),
+                            get('g', 0),
+                            get('b', 0),
+                            get('colorBrightness', 0),
+                            get('whiteBrightness', 0),
+                        )
                 return True
             else:
                 # If we can't read fresh state, restore the old cached version
                 self._cached_framebuffer = old_framebuffer
-                LOGGER.warning(f"Could not refresh framebuffer from device, keeping cached version")
+                LOGGER.warning("Could not refresh framebuffer from device, keeping cached version")
                 return False
                 
         except Exception as e:
-            LOGGER.error(f"Error refreshing framebuffer: {e}")
+            LOGGER.error("Error refreshing framebuffer: %s", e)
             return False
 
     def get_current_framebuffer(self) -> Optional[list[dict]]:
         """
         Get the current framebuffer state for individual bulb control.
         If we have our own cached version, use that. Otherwise try to read from resource.
+        The returned list is shared and must not be modified.
         """
         try:
             # If we have our own cached framebuffer, use it (this is the authoritative state)
             if self._cached_framebuffer is not None:
-                LOGGER.debug(f"SharedFramebufferContext: Using cached framebuffer with {len(self._cached_framebuffer)} bulbs")
+                LOGGER.debug(
+                    "SharedFramebufferContext: Using cached framebuffer with %s bulbs",
+                    len(self._cached_framebuffer),
+                )
                 return self._cached_framebuffer
             
+            # Bulbs ask together, so a failed read is not repeated straight away
+            now = time.monotonic()
+            if now - self._last_read_attempt < REFRESH_DEBOUNCE:
+                return None
+            self._last_read_attempt = now
+
             # Try to initialize from resource data if available
-            LOGGER.debug(f"SharedFramebufferContext: Attempting to initialize framebuffer from device {self.resource.id}")
-            return self._read_framebuffer_from_resource()
+            LOGGER.debug("SharedFramebufferContext: Attempting to initialize framebuffer from device %s", self.resource.id)
+            framebuffer = self._read_framebuffer_from_resource()
+            if framebuffer is not None:
+                self._cached_framebuffer = framebuffer
+            return framebuffer
             
         except Exception as e:
-            LOGGER.error(f"Error getting current framebuffer: {e}")
+            LOGGER.error("Error getting current framebuffer: %s", e)
             return None
 
     def get_power_state(self) -> Optional[str]:
-        """Get the power state from the resource."""
-        if hasattr(self.resource, 'on') and self.resource.on:
-            return 'on' if self.resource.on.on else 'off'
-        return None
+        """
+        Get the power state from the resource.
+        Bulbs ask together on every device update, so the value is reused
+        for REFRESH_DEBOUNCE seconds or until the power state is set.
+        """
+        now = time.monotonic()
+        if now - self._power_state_read < REFRESH_DEBOUNCE:
+            return self._power_state
+        on = getattr(self.resource, 'on', None)
+        self._power_state = ('on' if on.on else 'off') if on else None
+        self._power_state_read = now
+        return self._power_state
 
     async def update_framebuffer(self, bulb_index: int, bulb_data: dict) -> bool:
         """
         Update a specific bulb in the framebuffer and send to device.
+        Updates made within FRAMEBUFFER_WRITE_WINDOW seconds of each other,
+        such as a scene setting every bulb, are sent to the device together.
         """
         async with self._state_lock:
             try:
-                LOGGER.info(f"SharedFramebufferContext: Updating bulb {bulb_index} with {bulb_data}")
-                
-                # Get current framebuffer or create one
-                framebuffer = self.get_current_framebuffer()
-                
-                # If no framebuffer exists, we need to determine the expected bulb count
-                # and create an appropriate framebuffer
-                if not framebuffer:
-                    LOGGER.info("No existing framebuffer found, creating new one")
-                    
-                    # Use the configured expected bulb count, but ensure it's at least large enough for this bulb_index
-                    expected_bulb_count = max(self.expected_bulb_count, bulb_index + 1)
-                    
-                    # Create a new framebuffer with all bulbs off initially
-                    framebuffer = []
-                    for i in range(expected_bulb_count):
-                        default_bulb = {
-                            'r': 255, 'g': 255, 'b': 255,
-                            'colorBrightness': 0,
-                            'whiteBrightness': 0,
-                            'cct': 3500
-                        }
-                        framebuffer.append(default_bulb)
-                    
-                    LOGGER.info(f"Created new framebuffer with {expected_bulb_count} bulbs")
-                
-                # Ensure framebuffer is large enough for this bulb index
-                if bulb_index >= len(framebuffer):
-                    LOGGER.info(f"Extending framebuffer from {len(framebuffer)} to {bulb_index + 1} bulbs")
-                    while len(framebuffer) <= bulb_index:
-                        # Add more bulbs with default off state
-                        default_bulb = {
-                            'r': 255, 'g': 255, 'b': 255,
-                            'colorBrightness': 0,
-                            'whiteBrightness': 0,
-                            'cct': 3500
-                        }
-                        framebuffer.append(default_bulb)
-                
-                # Copy framebuffer to avoid mutating our cached version directly
-                new_framebuffer = [dict(b) for b in framebuffer]
-                
-                # Update the specific bulb
-                new_framebuffer[bulb_index].update(bulb_data)
-                
-                LOGGER.info(f"Updated bulb {bulb_index}: {new_framebuffer[bulb_index]}")
-                
-                # Build new sequence data
-                new_sequence_data = {
-                    "color-sequence-v2": {
-                        "sequenceFlags": 0,
-                        "brightnessSpeed": 50,
-                        "motionSpeed": 48,
-                        "motionEffect": 0,
-                        "brightnessEffect": 0,
-                        "headerFlags": 128,
-                        "frameBuffer": {
-                            "flags": 0,
-                            "framebuffer": new_framebuffer
-                        },
-                        "id": 0,
-                        "version": 1,
-                        "brightnessDepth": 100
-                    }
-                }
-                
-                # Send update to device
-                await self.bridge.async_request_call(
-                    self.controller.update,
-                    device_id=self.resource.id,
-                    states=[{
-                        "functionClass": "color-sequence-v2",
-                        "functionInstance": "custom-1",
-                        "value": new_sequence_data,
-                        "lastUpdateTime": int(time.time())
-                    }]
+                LOGGER.info(
+                    "SharedFramebufferContext: Updating bulb %s with %s",
+                    bulb_index,
+                    bulb_data,
                 )
-                
-                # Set color mode to individual and select the custom sequence
-                await self.bridge.async_request_call(
-                    self.controller.update,
-                    device_id=self.resource.id,
-                    states=[
-                        {
-                            "functionClass": "color-mode",
-                            "value": "individual",
-                            "lastUpdateTime": int(time.time())
-                        },
-                        {
-                            "functionClass": "color-individual",
-                            "functionInstance": "custom",
-                            "value": "custom-1",
-                            "lastUpdateTime": int(time.time())
-                        }
-                    ]
+                self._stage_bulb_update(bulb_index, bulb_data)
+            except Exception as e:
+                LOGGER.error("Failed to update framebuffer for bulb %s: %s", bulb_index, e)
+                return False
+            pending_write = self._pending_write
+            if pending_write is None:
+                pending_write = self._pending_write = (
+                    asyncio.get_running_loop().create_future()
                 )
+                is_leader = True
+            else:
+                is_leader = False
+        if not is_leader:
+            # Shielded so a cancelled caller does not cancel the shared result
+            return await asyncio.shield(pending_write)
+
+        result = False
+        try:
+            await asyncio.sleep(FRAMEBUFFER_WRITE_WINDOW)
+            async with self._state_lock:
+                framebuffer = self._take_pending_framebuffer()
+                result = await self._send_framebuffer(framebuffer)
+        finally:
+            # Also reached when the leader is cancelled: drop the batch if it
+            # was not taken yet and let the other callers see it was not sent
+            if self._pending_write is pending_write:
+                self._discard_pending_updates()
+            pending_write.set_result(result)
+        return result
+
+    def _stage_bulb_update(self, bulb_index: int, bulb_data: dict) -> None:
+        """
+        Apply a bulb update to the framebuffer waiting to be sent.
+        The first update of a batch copies the current framebuffer, so the
+        cache and the resource keep the last sent state until the send succeeds.
+        """
+        framebuffer = self._pending_framebuffer
+        if framebuffer is None:
+            # Get current framebuffer or create one
+            base = self.get_current_framebuffer()
+
+            # If no framebuffer exists, we need to determine the expected bulb count
+            # and create an appropriate framebuffer
+            if not base:
+                LOGGER.info("No existing framebuffer found, creating new one")
                 
-                # Update our cached framebuffer to the new state
-                # This ensures other bulbs see this update immediately
-                self._cached_framebuffer = new_framebuffer
-                self._framebuffer_initialized = True
+                # Use the configured expected bulb count, but ensure it's at least large enough for this bulb_index
+                expected_bulb_count = max(self.expected_bulb_count, bulb_index + 1)
                 
-                LOGGER.info(f"Successfully updated framebuffer for bulb {bulb_index} and cached new state")
-                return True
+                # Create a new framebuffer with all bulbs off initially
+                framebuffer = [DEFAULT_BULB.copy() for _ in range(expected_bulb_count)]
                 
-            except Exception as e:
-                LOGGER.error(f"Failed to update framebuffer for bulb {bulb_index}: {e}")
-                import traceback
-                LOGGER.error(f"Traceback: {traceback.format_exc()}")
-                return False
+                LOGGER.info("Created new framebuffer with %s bulbs", expected_bulb_count)
+            else:
+                framebuffer = clone_framebuffer(base)
+            self._pending_framebuffer = framebuffer
+            self._pending_base = self._cached_framebuffer
+
+        self._apply_bulb_update(framebuffer, bulb_index, bulb_data)
+        self._pending_updates.setdefault(bulb_index, {}).update(bulb_data)
+
+        LOGGER.info("Updated bulb %s: %s", bulb_index, framebuffer[bulb_index])
+
+    @staticmethod
+    def _apply_bulb_update(framebuffer: list[dict], bulb_index: int, bulb_data: dict) -> None:
+        """Update one bulb of a framebuffer, adding bulbs up to its index."""
+        # Ensure framebuffer is large enough for this bulb index
+        needed = bulb_index + 1 - len(framebuffer)
+        if needed > 0:
+            LOGGER.info("Extending framebuffer from %s to %s bulbs", len(framebuffer), bulb_index + 1)
+            # Add more bulbs with default off state
+            framebuffer.extend(DEFAULT_BULB.copy() for _ in range(needed))
+        framebuffer[bulb_index].update(bulb_data)
+
+    def _take_pending_framebuffer(self) -> list[dict]:
+        """
+        Remove the staged batch and return the framebuffer to send for it.
+        If the cache was refreshed while the batch waited, the staged bulb
+        updates are applied to a copy of the refreshed framebuffer instead.
+        """
+        framebuffer = self._pending_framebuffer
+        current = self._cached_framebuffer
+        if current is not None and current is not self._pending_base:
+            framebuffer = clone_framebuffer(current)
+            for bulb_index, bulb_data in self._pending_updates.items():
+                self._apply_bulb_update(framebuffer, bulb_index, bulb_data)
+        self._discard_pending_updates()
+        return framebuffer
+
+    def _discard_pending_updates(self) -> None:
+        """Forget the staged batch, leaving the cached framebuffer as sent."""
+        self._pending_framebuffer = None
+        self._pending_base = None
+        self._pending_updates = {}
+        self._pending_write = None
+
+    async def _send_framebuffer(self, new_framebuffer: list[dict]) -> bool:
+        """Send a framebuffer to the device and cache it once accepted."""
+        try:
+            # Build new sequence data
+            new_sequence_data = {
+                "color-sequence-v2": {
+                    **SEQUENCE_TEMPLATE,
+                    "frameBuffer": {"flags": 0, "framebuffer": new_framebuffer},
+                }
+            }
+
+            last_update = int(time.time())
+            states = [
+                {
+                    **SEQUENCE_STATE,
+                    "value": new_sequence_data,
+                    "lastUpdateTime": last_update
+                }
+            ]
+            # Set color mode to individual and select the custom sequence,
+            # unless we already did and the device is still in that mode
+            send_mode = not (
+                self._individual_mode_sent
+                and getattr(self.resource.color_mode, 'mode', None) == "individual"
+            )
+            if send_mode:
+                states.extend(
+                    {**state, "lastUpdateTime": last_update}
+                    for state in INDIVIDUAL_MODE_STATES
+                )
+
+            # Send update to device
+            await self.bridge.async_request_call(
+                self.controller.update,
+                device_id=self.resource.id,
+                states=states
+            )
+            self._individual_mode_sent = True
+
+            # Update our cached framebuffer to the new state
+            # This ensures other bulbs see this update immediately
+            self._cached_framebuffer = new_framebuffer
+            self._framebuffer_initialized = True
+
+            LOGGER.info(
+                "Successfully sent framebuffer with %s bulbs and cached new state",
+                len(new_framebuffer),
+            )
+            return True
+
+        except Exception as e:
+            LOGGER.error("Failed to send framebuffer: %s", e)
+            import traceback
+            LOGGER.error("Traceback: %s", traceback.format_exc())
+            return False
 
     async def set_power_state(self, power_state: str) -> bool:
         """Set the power state of the string light."""
+        # The device state changes, so read it again next time
+        self._power_state_read = -REFRESH_DEBOUNCE
         try:
             await self.bridge.async_request_call(
                 self.controller.set_state,
@@ -282,7 +506,7 @@ class SharedFramebufferContext:
             )
             return True
         except Exception as e:
-            LOGGER.error(f"Failed to set power state: {e}")
+            LOGGER.error("Failed to set power state: %s", e)
             return False
 
 
@@ -295,14 +519,21 @@ def get_shared_context(resource: Light, bridge: HubspaceBridge, expected_bulb_co
     Get or create a shared framebuffer context for a device.
     All bulbs for the same device will share this context.
     """
-    if resource.id not in _shared_contexts:
-        _shared_contexts[resource.id] = SharedFramebufferContext(resource, bridge, expected_bulb_count)
-        LOGGER.info(f"Created shared framebuffer context for device {resource.id} with {expected_bulb_count} bulbs")
-    return _shared_contexts[resource.id]
+    context = _shared_contexts.get(resource.id)
+    if context is None:
+        context = _shared_contexts[resource.id] = SharedFramebufferContext(
+            resource, bridge, expected_bulb_count
+        )
+        LOGGER.info(
+            "Created shared framebuffer context for device %s with %s bulbs",
+            resource.id,
+            expected_bulb_count,
+        )
+    return context
 
 
 def cleanup_shared_context(device_id: str):
     """Clean up shared context when device is removed."""
     if device_id in _shared_contexts:
         del _shared_contexts[device_id]
-        LOGGER.info(f"Cleaned up shared framebuffer context for device {device_id}")
+        LOGGER.info("Cleaned up shared framebuffer context for device %s", device_id)
@@ -1,5 +1,8 @@
 """Test the integration between Home Assistant Lights and Afero devices."""
 
+import asyncio
+from types import SimpleNamespace
+
 from aioafero import AferoState
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -9,7 +12,9 @@ from homeassistant.components.light import (
     ATTR_RGB_COLOR,
     ColorMode,
 )
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.color import brightness_to_value
 import pytest
 
 from custom_components.hubspace import light
@@ -91,7 +96,163 @@ def test_get_color_mode(color_mode, supported, expected, mocked_entity):
         tmp_light.color_mode.mode = color_mode
     else:
         tmp_light.color_mode = None
-    assert light.get_color_mode(tmp_light, supported) == expected
+    color_mode_map = light.get_color_mode_map(supported)
+    fallback_modes = light.get_fallback_color_modes(supported)
+    assert (
+        light.get_color_mode(tmp_light, color_mode_map, fallback_modes) == expected
+    )
+
+
+def test_to_device_brightness():
+    """Ensure the brightness conversion matches Home Assistant's helper."""
+    for brightness in range(256):
+        assert light.to_device_brightness(brightness) == int(
+            brightness_to_value((1, 100), brightness)
+        )
+
+
+def test_merge_bulb_state():
+    """Ensure framebuffer values are applied and unknown keys ignored."""
+    state = light.merge_bulb_state(
+        light.BulbState(), {"r": 10, "colorBrightness": 0, "whiteBrightness": 40, "x": 1}
+    )
+    assert state == light.BulbState(
+        r=10, g=255, b=255, color_brightness=0, white_brightness=40, cct=3500
+    )
+
+
+def make_string_light(
+    name=None, default_name=None, default_image=None, model=None, instances=None
+):
+    """Create a light resource with the details used by string light detection."""
+    return SimpleNamespace(
+        id="string-light",
+        device_information=SimpleNamespace(
+            name=name,
+            default_name=default_name,
+            default_image=default_image,
+            model=model,
+        ),
+        instances=instances or {},
+    )
+
+
+@pytest.mark.parametrize(
+    ("resource", "expected"),
+    [
+        # Default name
+        (make_string_light(default_name="String Lights"), (True, 12)),
+        # Hampton Bay model
+        (make_string_light(model="HB-10521-HS"), (True, 12)),
+        # Device name
+        (make_string_light(name="Patio String Light"), (True, 12)),
+        # Framebuffer instance, bulbs counted from its state
+        (
+            make_string_light(
+                instances={
+                    "color-sequence-v2": SimpleNamespace(
+                        state=SimpleNamespace(framebuffer=[{}] * 24)
+                    )
+                }
+            ),
+            (True, 24),
+        ),
+        # Default image
+        (make_string_light(default_image="string-lights-icon"), (True, 12)),
+        # Not a string light
+        (
+            make_string_light(
+                name="Kitchen Light", default_name="Light", model="HB-10521"
+            ),
+            (False, 0),
+        ),
+    ],
+)
+def test_get_string_light_info(resource, expected):
+    """Ensure string lights are detected and their bulbs counted."""
+    cache = {}
+    assert light.get_string_light_info(resource, cache) == expected
+    assert (resource.id in cache) is expected[0]
+
+
+@pytest.mark.parametrize(
+    ("instance", "expected"),
+    [
+        # Bulb data in the instance state
+        (SimpleNamespace(state=SimpleNamespace(sequence=[{"r": 1}] * 10)), 10),
+        # Instance capabilities
+        (SimpleNamespace(state=None, capabilities=SimpleNamespace(maxBulbs=8)), 8),
+        # Default framebuffer size
+        (SimpleNamespace(state=None, default_framebuffer_size=16), 16),
+        # Nothing reported
+        (SimpleNamespace(state=None), 12),
+    ],
+)
+def test_get_string_light_info_bulb_count(instance, expected):
+    """Ensure the bulb count is read from the framebuffer instance."""
+    resource = make_string_light(
+        default_name="String Lights", instances={"color-sequence-v2": instance}
+    )
+    assert light.get_string_light_info(resource, {}) == (True, expected)
+
+
+@pytest.fixture
+def string_light_bulb(mocker):
+    """Create the first bulb of a string light with a mocked shared context."""
+    context = mocker.Mock()
+    context.get_power_state.return_value = "on"
+    context.update_framebuffer = mocker.AsyncMock(return_value=True)
+    mocker.patch.object(light, "get_shared_context", return_value=context)
+    resource = mocker.Mock(id="string-light", supports_color_temperature=True)
+    bulb = light.HubspaceStringLightBulb(
+        mocker.Mock(), mocker.Mock(), resource, 0, 12
+    )
+    mocker.patch.object(bulb, "async_write_ha_state")
+    return bulb, context
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("kwargs", "bulb_data", "color_mode", "brightness"),
+    [
+        # RGB color
+        (
+            {ATTR_RGB_COLOR: (10, 20, 30), ATTR_BRIGHTNESS: 255},
+            {"r": 10, "g": 20, "b": 30, "colorBrightness": 100, "whiteBrightness": 0},
+            ColorMode.RGB,
+            255,
+        ),
+        # Color temperature
+        (
+            {ATTR_COLOR_TEMP_KELVIN: 3000},
+            {
+                "cct": 3000,
+                "whiteBrightness": 100,
+                "colorBrightness": 0,
+                "r": 0,
+                "g": 0,
+                "b": 0,
+            },
+            ColorMode.COLOR_TEMP,
+            255,
+        ),
+        # Brightness only
+        ({ATTR_BRIGHTNESS: 128}, {"colorBrightness": 50}, ColorMode.RGB, 128),
+        # Nothing requested
+        ({}, {"colorBrightness": 100}, ColorMode.RGB, 255),
+    ],
+)
+async def test_string_light_bulb_turn_on(
+    kwargs, bulb_data, color_mode, brightness, string_light_bulb
+):
+    """Ensure a string light bulb sends the requested state for its bulb."""
+    bulb, context = string_light_bulb
+    await bulb.async_turn_on(**kwargs)
+    context.update_framebuffer.assert_called_once_with(0, bulb_data)
+    context.set_power_state.assert_not_called()
+    assert bulb.is_on
+    assert bulb.color_mode == color_mode
+    assert bulb.brightness == brightness
 
 
 @pytest.mark.asyncio
@@ -173,6 +334,54 @@ async def test_turn_on(mocked_entity):
     assert bridge.lights[light_a21.id].brightness == 25
 
 
+@pytest.mark.asyncio
+async def test_update_clears_cached_state(mocked_entity):
+    """Ensure values cached by the light are read again after an update."""
+    hass, _, bridge = mocked_entity
+    entity = hass.states.get(light_a21_id)
+    assert entity.state == "on"
+    assert entity.attributes["brightness"] == 128
+    assert entity.attributes[ATTR_COLOR_TEMP_KELVIN] == 4000
+    hs_device_update = create_devices_from_data("light-a21.json")[0]
+    modify_state(
+        hs_device_update,
+        AferoState(
+            functionClass="brightness",
+            functionInstance=None,
+            value=40,
+        ),
+    )
+    modify_state(
+        hs_device_update,
+        AferoState(
+            functionClass="color-temperature",
+            functionInstance=None,
+            value=3000,
+        ),
+    )
+    event = {
+        "type": "update",
+        "device_id": light_a21.id,
+        "device": hs_device_update,
+    }
+    bridge.emit_event("update", event)
+    await hass.async_block_till_done()
+    entity = hass.states.get(light_a21_id)
+    assert entity.state == "on"
+    assert entity.attributes["brightness"] == 102
+    assert entity.attributes[ATTR_COLOR_TEMP_KELVIN] == 3000
+    modify_state(
+        hs_device_update,
+        AferoState(
+            functionClass="power",
+            functionInstance=None,
+            value="off",
+        ),
+    )
+    bridge.emit_event("update", event)
+    await hass.async_block_till_done()
+    assert hass.states.get(light_a21_id).state == "off"
+
 @pytest.mark.asyncio
 async def test_turn_on_temp(mocked_entity):
     """Ensure the service call turn_on works as expected."""
@@ -509,3 +718,95 @@ async def test_add_new_device(mocked_entry):
     entity_reg = er.async_get(hass)
     for entity in expected_entities:
         assert entity_reg.async_get(entity) is not None
+
+
+@pytest.fixture
+def dual_mode_bridge(mocker):
+    """Create a bridge whose requests are recorded."""
+    bridge = mocker.Mock()
+    bridge.async_request_call = mocker.AsyncMock(return_value=None)
+    return bridge
+
+
+@pytest.mark.asyncio
+async def test_set_dual_mode_state_merged(dual_mode_bridge, mocker):
+    """Ensure both portions turned on together are sent in one request."""
+    controller = mocker.Mock()
+    await asyncio.gather(
+        light.async_set_dual_mode_state(
+            dual_mode_bridge,
+            controller,
+            "dual",
+            on=True,
+            colorBrightness=50,
+            defaults={"whiteBrightness": 0},
+        ),
+        light.async_set_dual_mode_state(
+            dual_mode_bridge,
+            controller,
+            "dual",
+            on=True,
+            whiteBrightness=30,
+            defaults={"colorBrightness": 0},
+        ),
+    )
+    dual_mode_bridge.async_request_call.assert_called_once_with(
+        controller.set_state,
+        device_id="dual",
+        on=True,
+        colorBrightness=50,
+        whiteBrightness=30,
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_dual_mode_state_error(dual_mode_bridge, mocker):
+    """Ensure a failed request is raised to every merged write."""
+    dual_mode_bridge.async_request_call.side_effect = HomeAssistantError("nope")
+    results = await asyncio.gather(
+        light.async_set_dual_mode_state(
+            dual_mode_bridge, mocker.Mock(), "dual", colorBrightness=0
+        ),
+        light.async_set_dual_mode_state(
+            dual_mode_bridge, mocker.Mock(), "dual", whiteBrightness=0
+        ),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, HomeAssistantError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_set_dual_mode_state_cancelled(dual_mode_bridge, mocker):
+    """Ensure merged writes finish when the sending write is cancelled."""
+    sending = asyncio.Event()
+
+    async def blocking_send(*args, **kwargs):
+        sending.set()
+        await asyncio.Event().wait()
+
+    dual_mode_bridge.async_request_call.side_effect = blocking_send
+    controller = mocker.Mock()
+    leader = asyncio.create_task(
+        light.async_set_dual_mode_state(
+            dual_mode_bridge, controller, "dual", colorBrightness=0
+        )
+    )
+    follower = asyncio.create_task(
+        light.async_set_dual_mode_state(
+            dual_mode_bridge, controller, "dual", whiteBrightness=0
+        )
+    )
+    await sending.wait()
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    with pytest.raises(HomeAssistantError):
+        await follower
+    # A later write is sent on its own
+    dual_mode_bridge.async_request_call.side_effect = None
+    await light.async_set_dual_mode_state(
+        dual_mode_bridge, controller, "dual", colorBrightness=10
+    )
+    dual_mode_bridge.async_request_call.assert_called_with(
+        controller.set_state, device_id="dual", colorBrightness=10
+    )
@@ -0,0 +1,106 @@
+"""Test the shared framebuffer of string lights."""
+
+import asyncio
+
+import pytest
+
+from custom_components.hubspace import shared_framebuffer
+
+
+@pytest.fixture
+def framebuffer_context(mocker):
+    """Create a context for a three bulb string light."""
+    resource = mocker.Mock(id="string-light", instances={})
+    bridge = mocker.Mock()
+    bridge.async_request_call = mocker.AsyncMock(return_value=None)
+    return shared_framebuffer.SharedFramebufferContext(resource, bridge, 3)
+
+
+@pytest.mark.asyncio
+async def test_update_framebuffer_batches_writes(framebuffer_context):
+    """Ensure bulb updates made together are sent in one update."""
+    results = await asyncio.gather(
+        *(
+            framebuffer_context.update_framebuffer(
+                bulb_index, {"colorBrightness": 10 * (bulb_index + 1)}
+            )
+            for bulb_index in range(3)
+        )
+    )
+    assert results == [True, True, True]
+    request_call = framebuffer_context.bridge.async_request_call
+    request_call.assert_called_once()
+    states = request_call.call_args.kwargs["states"]
+    framebuffer = states[0]["value"]["color-sequence-v2"]["frameBuffer"]["framebuffer"]
+    assert [bulb["colorBrightness"] for bulb in framebuffer] == [10, 20, 30]
+    assert framebuffer_context.get_current_framebuffer() is framebuffer
+
+
+@pytest.mark.asyncio
+async def test_update_framebuffer_failed_send(framebuffer_context):
+    """Ensure a failed send leaves the cached framebuffer unchanged."""
+    assert await framebuffer_context.update_framebuffer(0, {"colorBrightness": 50})
+    framebuffer_context.bridge.async_request_call.side_effect = RuntimeError("nope")
+    assert not await framebuffer_context.update_framebuffer(0, {"colorBrightness": 0})
+    assert framebuffer_context.get_current_framebuffer()[0]["colorBrightness"] == 50
+
+
+@pytest.mark.asyncio
+async def test_request_refresh_notifies_listeners(framebuffer_context, mocker):
+    """Ensure updates for all bulbs refresh once and notify every listener."""
+    hass = mocker.Mock()
+    hass.async_create_task = asyncio.ensure_future
+    failing_listener = mocker.Mock(side_effect=RuntimeError("nope"))
+    listener = mocker.Mock()
+    framebuffer_context.register_listener(failing_listener)
+    remove_listener = framebuffer_context.register_listener(listener)
+    refreshes = [framebuffer_context.request_refresh(hass) for _ in range(3)]
+    await asyncio.gather(*refreshes)
+    failing_listener.assert_called_once_with()
+    listener.assert_called_once_with()
+    remove_listener()
+    await framebuffer_context.request_refresh(hass)
+    listener.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_update_framebuffer_staged_until_sent(framebuffer_context):
+    """Ensure the cached framebuffer only changes once an update is sent."""
+    assert await framebuffer_context.update_framebuffer(0, {"colorBrightness": 50})
+    update = asyncio.create_task(
+        framebuffer_context.update_framebuffer(0, {"colorBrightness": 0})
+    )
+    await asyncio.sleep(0)
+    assert framebuffer_context.get_current_framebuffer()[0]["colorBrightness"] == 50
+    assert await update
+    assert framebuffer_context.get_current_framebuffer()[0]["colorBrightness"] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_framebuffer_leader_cancelled(framebuffer_context):
+    """Ensure waiting bulb updates finish when the sending update is cancelled."""
+    assert await framebuffer_context.update_framebuffer(0, {"colorBrightness": 50})
+    request_call = framebuffer_context.bridge.async_request_call
+    sending = asyncio.Event()
+
+    async def blocking_send(*args, **kwargs):
+        sending.set()
+        await asyncio.Event().wait()
+
+    request_call.side_effect = blocking_send
+    leader = asyncio.create_task(
+        framebuffer_context.update_framebuffer(0, {"colorBrightness": 0})
+    )
+    follower = asyncio.create_task(
+        framebuffer_context.update_framebuffer(1, {"colorBrightness": 0})
+    )
+    await sending.wait()
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert not await follower
+    assert framebuffer_context.get_current_framebuffer()[0]["colorBrightness"] == 50
+    request_call.side_effect = None
+    assert await framebuffer_context.update_framebuffer(1, {"colorBrightness": 20})
+    framebuffer = framebuffer_context.get_current_framebuffer()
+    assert [bulb["colorBrightness"] for bulb in framebuffer[:2]] == [50, 20]